@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MicBoard Kayıt Taşması Benchmark Scripti
+Bu script, AudioRecorder'ı PortAudio gibi sınırlı bir giriş tamponu olan
+sahte bir cihazla yük altında çalıştırır. Tanıma ve arayüz thread'lerini
+taklit eden GIL yoğun thread'ler ve ara sıra uzun süren sessizlik analizi
+eklenir. Cihaz, okuma zamanında yapılmadığı için kaybolan çerçeveleri
+sayar; kaydedici tarafında atılan çerçeveler de raporlanır.
+Ardından PyAudioSource, PyAudio gibi taşma istisnasında akışını kapatan
+sahte bir PortAudio ile çalıştırılır: taşmaların sayıldığı ve kaydın
+kesilmeden sürdüğü doğrulanır.
+Kullanım: python benchmarks/bench_capture.py [--seconds 10] [--load-threads 2] [--spike-ms 150]
+"""
+
+import os
+import sys
+import time
+import argparse
+import threading
+import types
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import micboard
+from micboard import AdaptiveSilenceDetector, AudioRecorder, AudioSource, PipelineQueue, PyAudioSource
+from benchmarks.pipeline import synthetic_speech
+
+
+class BufferedDevice(AudioSource):
+    """Çerçeveleri gerçek zamanlı üreten, giriş tamponu dolunca eski çerçeveleri kaybeden sahte cihaz"""
+
+    def __init__(self, pattern, rate, seconds, buffer_frames):
+        self.rate = rate
+        # Desen, sarmalı okumalar kopyasız dilimlenebilsin diye iki kez yan yana tutulur
+        self.pattern_frames = len(pattern)
+        self.pattern = np.tile(pattern.astype("<i2"), 2).tobytes()
+        self.total = int(seconds * rate)
+        self.buffer_frames = buffer_frames
+        self.opened_at = None
+        self.position = 0
+        self.overflows = 0
+        self.lost_frames = 0
+
+    def open(self):
+        self.opened_at = time.perf_counter()
+        self.position = 0
+
+    def read(self, frames):
+        if self.position >= self.total:
+            return b""
+        produced = int((time.perf_counter() - self.opened_at) * self.rate)
+        if produced - self.position > self.buffer_frames:
+            # Okuma gecikti: tampona sığmayan çerçeveler kayboldu
+            lost = produced - self.position - self.buffer_frames
+            self.overflows += 1
+            self.lost_frames += lost
+            self.position += lost
+        ready_at = self.opened_at + (self.position + frames) / self.rate
+        delay = ready_at - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        start = self.position % self.pattern_frames
+        self.position += frames
+        return self.pattern[start * 2:(start + frames) * 2]
+
+
+class SpikyDetector(AdaptiveSilenceDetector):
+    """Her `every` parçada bir, işlemciyi spike_ms boyunca meşgul eden sessizlik algılayıcı"""
+
+    def __init__(self, every, spike_ms):
+        super().__init__()
+        self.every = every
+        self.spike = spike_ms / 1000
+        self.calls = 0
+
+    def is_silent(self, samples):
+        self.calls += 1
+        if self.spike and self.calls % self.every == 0:
+            end = time.perf_counter() + self.spike
+            while time.perf_counter() < end:
+                pass
+        return super().is_silent(samples)
+
+
+class FakePortAudioStream:
+    """PyAudio akışını taklit eder; her `overflow_every` tamponda bir giriş taşması olur
+
+    Geri çağırma modunda tamponlar ayrı bir thread'den paInputOverflow
+    bayrağıyla verilir. Engelleyen okumada PyAudio 0.2.13/0.2.14 gibi
+    davranır: taşma istisnası akışı kapatır, sonraki okuma "Stream closed"
+    hatası verir.
+    """
+
+    def __init__(self, module, rate, frames_per_buffer, seconds, overflow_every, stream_callback=None, **_):
+        self.module = module
+        self.rate = rate
+        self.frames_per_buffer = frames_per_buffer
+        self.buffers = int(seconds * rate / frames_per_buffer)
+        self.overflow_every = overflow_every
+        self.callback = stream_callback
+        self.index = 0
+        self.closed = False
+        self.active = True
+        if stream_callback is not None:
+            self.thread = threading.Thread(target=self._run, daemon=True)
+            self.thread.start()
+
+    def _buffer(self):
+        self.index += 1
+        flags = self.module.paInputOverflow if self.index % self.overflow_every == 0 else 0
+        return b"\x10\x00" * self.frames_per_buffer, flags
+
+    def _run(self):
+        started = time.perf_counter()
+        while self.active and self.index < self.buffers:
+            data, flags = self._buffer()
+            self.callback(data, self.frames_per_buffer, {}, flags)
+            delay = started + self.index * self.frames_per_buffer / self.rate - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        self.active = False
+
+    def read(self, frames, exception_on_overflow=True):
+        if self.closed:
+            raise IOError(self.module.paBadStreamPtr, "Stream closed")
+        data, flags = self._buffer()
+        if flags and exception_on_overflow:
+            self.closed = True  # PyAudioStream_Cleanup: akış istisnadan önce kapatılır
+            raise IOError(self.module.paInputOverflowed, "Input overflowed")
+        return data
+
+    def is_active(self):
+        return self.active and not self.closed
+
+    def stop_stream(self):
+        self.active = False
+
+    def close(self):
+        self.active = False
+        self.closed = True
+
+
+def fake_portaudio(seconds, overflow_every):
+    """PyAudioSource'un kullandığı pyaudio modülü yerine geçen sahte modül"""
+    module = types.SimpleNamespace(paInt16=8, paContinue=0, paInputOverflow=2,
+                                   paInputOverflowed=-9981, paBadStreamPtr=-9988)
+
+    class FakePyAudio:
+        def get_sample_size(self, fmt):
+            return 2
+
+        def open(self, **options):
+            return FakePortAudioStream(module, seconds=seconds, overflow_every=overflow_every, **options)
+
+        def terminate(self):
+            pass
+
+    module.PyAudio = FakePyAudio
+    return module
+
+
+def check_pyaudio_overflow(seconds=2.0, overflow_every=10):
+    """PyAudioSource'un taşmaları sayıp kayda devam ettiğini doğrular; başarılıysa True döndürür"""
+    original = micboard.pyaudio
+    micboard.pyaudio = fake_portaudio(seconds, overflow_every)
+    try:
+        source = PyAudioSource(rate=16000, frames_per_buffer=1024)
+        recorder = AudioRecorder(PipelineQueue(0, name="audio_queue"), source=source)
+        read = []
+        capture = recorder._capture_audio
+
+        def counting_capture(stop_event):
+            original_read = source.read
+
+            def read_and_count(frames):
+                data = original_read(frames)
+                read.append(len(data) // 2)
+                return data
+
+            source.read = read_and_count
+            capture(stop_event)
+
+        recorder._capture_audio = counting_capture
+        recorder.start_recording()
+        deadline = time.monotonic() + seconds + 5
+        while recorder.is_recording and time.monotonic() < deadline:
+            time.sleep(0.05)
+        recorder.stop_recording()
+    finally:
+        micboard.pyaudio = original
+    expected = int(seconds * 16000 / 1024)
+    print(f"PyAudioSource: {sum(read) / 16000:.2f} sn okundu ({seconds:.1f} sn beklendi), "
+          f"{source.overflows} taşma sayıldı ({expected // overflow_every} bekleniyordu)")
+    return sum(read) >= (expected - 1) * 1024 and source.overflows == expected // overflow_every
+
+
+def gil_load(stop):
+    """Tanıma ve arayüz thread'lerini taklit eden saf Python döngüsü"""
+    while not stop.is_set():
+        sum(i * i for i in range(2000))
+
+
+def main():
+    """Ana fonksiyon."""
+    parser = argparse.ArgumentParser(description="MicBoard kayıt taşması benchmark aracı")
+    parser.add_argument("--seconds", type=float, default=10.0, help="Kayıt süresi (sn)")
+    parser.add_argument("--rate", type=int, default=48000, help="Cihazın örnekleme hızı (Hz)")
+    parser.add_argument("--buffer-ms", type=float, default=85.0, help="Cihazın giriş tamponu (ms)")
+    parser.add_argument("--load-threads", type=int, default=2, help="GIL yoğun yük thread'i sayısı")
+    parser.add_argument("--spike-every", type=int, default=25, help="Kaç parçada bir yavaş analiz yapılacağı")
+    parser.add_argument("--spike-ms", type=float, default=150.0, help="Yavaş analizin süresi (ms)")
+    args = parser.parse_args()
+
+    device = BufferedDevice(synthetic_speech(6, args.rate), args.rate, args.seconds,
+                            int(args.buffer_ms / 1000 * args.rate))
+    audio_queue = PipelineQueue(0, name="audio_queue")
+    recorder = AudioRecorder(audio_queue, detector=SpikyDetector(args.spike_every, args.spike_ms), source=device)
+
+    stop = threading.Event()
+    loaders = [threading.Thread(target=gil_load, args=(stop,), daemon=True) for _ in range(args.load_threads)]
+    for thread in loaders:
+        thread.start()
+    start = time.perf_counter()
+    recorder.start_recording()
+    while recorder.is_recording:
+        time.sleep(0.05)
+    elapsed = time.perf_counter() - start
+    recorder.stop_recording()
+    stop.set()
+
+    frames = getattr(recorder, "frames", None)
+    dropped = f"{frames.dropped} parça" if frames is not None else "yok"
+    print(f"{args.seconds:.0f} sn kayıt {elapsed:.1f} sn sürdü; {args.load_threads} yük thread'i, "
+          f"her {args.spike_every} parçada {args.spike_ms:.0f} ms yavaş analiz")
+    print(f"Cihaz taşması: {device.overflows} kez, {device.lost_frames / args.rate * 1000:.0f} ms ses kayboldu")
+    print(f"Kaydedici tamponundan atılan: {dropped}; {recorder.segments_enqueued} parça tanımaya gönderildi")
+    if device.overflows:
+        print("BAŞARISIZ: cihaz tamponu taştı")
+        sys.exit(1)
+    if not check_pyaudio_overflow():
+        print("BAŞARISIZ: PyAudioSource taşmadan sonra kayda devam etmedi ya da taşmaları saymadı")
+        sys.exit(1)
+    print("BAŞARILI: hiç çerçeve kaybolmadı; cihaz taşmaları kaydı kesmeden sayıldı")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MicBoard Tanıma Son Tarihi Benchmark Scripti
+Bu script, SpeechRecognizer'ı gecikme ve hata enjekte eden yerel taklit
+sunucuya karşı konuşma hızında parça besleyerek çalıştırır. Her senaryo,
+son tarih / yeniden deneme / devre kesici kapalıyken (eski davranış) ve
+açıkken ölçülür: yazılan, geç kaldığı için atılan, hata veren ve devre
+açıkken gönderilmeyen parçalar ile en geç yazılan metnin gecikmesi
+raporlanır. Ardından devre kesicinin deneme isteği son tarihten sonra
+hata verdiğinde ve hiç sonuçlanmadığında devrenin kilitlenmeden yeniden
+kapandığı denetlenir. Yeni davranışta hiçbir metin max_age'den geç
+yazılmazsa ve devre kapanırsa başarılıdır; aksi halde çıkış kodu 1 olur.
+Kullanım: python benchmarks/bench_deadline.py [--segments 20] [--interval 0.5] [--max-age 3]
+"""
+
+import os
+import sys
+import time
+import argparse
+import threading
+
+import numpy as np
+import speech_recognition as sr
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from micboard import (AudioSegment, CircuitBreaker, GoogleWebBackend, LatencyTracer, PipelineQueue,
+                      RecognitionBackend, SpeechRecognizer, UtteranceTrace)
+from standin_server import StandInServer
+
+# (ad, yanıt gecikmesi, rastgele ek gecikme, hata oranı, kesinti mi)
+SCENARIOS = [
+    ("sağlıklı", 0.1, 0.1, 0.0, False),
+    ("yavaş", 0.5, 2.5, 0.0, False),
+    ("kararsız", 0.1, 0.1, 0.3, False),
+    ("kesinti", 0.05, 0.0, 0.0, True),
+]
+
+
+class RecoveringBackend(RecognitionBackend):
+    """İlk istekleri verilen gecikmelerle hata vererek yanıtlayıp sonra düzelen sahte motor
+
+    lost True ise ilk istekten sonraki hatalar RequestError değil başka bir
+    istisnadır; sonuçları devre kesiciye hiç bildirilmez.
+    """
+
+    name = "recovering"
+    sample_rate = None
+
+    def __init__(self, delays, lost=False):
+        super().__init__()
+        self.delays = delays
+        self.lost = lost
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def recognize(self, segment):
+        with self.lock:
+            index = self.calls
+            self.calls += 1
+        if index >= len(self.delays):
+            return "merhaba"
+        time.sleep(self.delays[index])
+        if self.lost and index:
+            raise RuntimeError("bağlantı koptu")
+        raise sr.RequestError("zaman aşımı")
+
+
+def check_probe(lost):
+    """Deneme isteği son tarihten sonra hata verdiğinde (ya da kaybolduğunda) devrenin yeniden kapandığını sınar"""
+    audio_queue = PipelineQueue(0, name="audio_queue")
+    text_queue = PipelineQueue(0, name="text_queue")
+    tracer = LatencyTracer()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.1)
+    # İlk istek hemen hata verip devreyi açar; ikincisi deneme isteğidir ve
+    # sonucu son tarihten (0.2 sn) sonra gelir
+    recognizer = SpeechRecognizer(audio_queue, text_queue, tracer, workers=1,
+                                  backend=RecoveringBackend([0.0, 0.3], lost), max_age=0.2, max_retries=0,
+                                  breaker=breaker)
+    recognizer.start_processing()
+    typed = 0
+    deadline = time.monotonic() + 5.0
+    while not typed and time.monotonic() < deadline:
+        trace = UtteranceTrace()
+        trace.mark("speech_end")
+        audio_queue.offer(AudioSegment(b"\0\0" * 160, 16000, trace))
+        time.sleep(0.1)
+        while True:
+            try:
+                text_queue.get_nowait()
+            except Exception:
+                break
+            typed += 1
+    recognizer.stop_processing()
+    label = "kaybolan deneme isteği" if lost else "geç hata veren deneme isteği"
+    print(f"{label:<29} devre {breaker.state:<9} açılma {breaker.trips}  yazılan {typed}")
+    return typed > 0 and breaker.state == "closed"
+
+
+def run(scenario, new, args):
+    """Bir senaryoyu çalıştırır; sonuç sözlüğü döndürür"""
+    name, delay, jitter, error_rate, outage = scenario
+    server = StandInServer(response_delay=delay, jitter=jitter, error_rate=error_rate).start()
+    audio_queue = PipelineQueue(0, name="audio_queue")
+    text_queue = PipelineQueue(0, name="text_queue")
+    tracer = LatencyTracer()
+    backend = GoogleWebBackend(url=server.url, upload_encoding="raw")
+    if new:
+        recognizer = SpeechRecognizer(audio_queue, text_queue, tracer, workers=args.workers, backend=backend,
+                                      max_age=args.max_age, max_retries=args.retries,
+                                      breaker=CircuitBreaker(5, args.reset_timeout))
+    else:
+        recognizer = SpeechRecognizer(audio_queue, text_queue, tracer, workers=args.workers, backend=backend,
+                                      max_age=0, max_retries=0, breaker=CircuitBreaker(0))
+
+    lateness = []
+
+    def consume():
+        while len(tracer.traces) < args.segments:
+            try:
+                item = text_queue.get(timeout=0.1)
+            except Exception:
+                continue
+            lateness.append(time.perf_counter() - item.trace.events["speech_end"])
+            tracer.finish(item.trace, "typed")
+
+    consumer = threading.Thread(target=consume, daemon=True)
+    consumer.start()
+    recognizer.start_processing()
+    audio = (np.sin(np.arange(16000) / 16000 * 2 * np.pi * 220) * 3000).astype("<i2").tobytes()
+    start = time.perf_counter()
+    for index in range(args.segments):
+        if outage:
+            # İlk yarıda servis tamamen çöker, sonra geri gelir
+            server.error_rate = 1.0 if index < args.segments // 2 else 0.0
+        trace = UtteranceTrace()
+        trace.mark("speech_end")
+        trace.mark("enqueued")
+        audio_queue.offer(AudioSegment(audio, 16000, trace))
+        time.sleep(args.interval)
+    consumer.join(timeout=300)
+    elapsed = time.perf_counter() - start
+    recognizer.stop_processing()
+    backend.close()
+    server.shutdown()
+    server.server_close()
+
+    outcomes = {}
+    for trace in tracer.traces:
+        outcomes[trace.outcome] = outcomes.get(trace.outcome, 0) + 1
+    return {
+        "outcomes": outcomes,
+        "requests": server.counters["requests"],
+        "worst": max(lateness) if lateness else 0.0,
+        "elapsed": elapsed,
+        "retries": recognizer.retries,
+    }
+
+
+def main():
+    """Ana fonksiyon."""
+    parser = argparse.ArgumentParser(description="MicBoard tanıma son tarihi benchmark aracı")
+    parser.add_argument("--segments", type=int, default=20, help="Senaryo başına parça sayısı")
+    parser.add_argument("--interval", type=float, default=0.5, help="Parçalar arasındaki süre (sn)")
+    parser.add_argument("--workers", type=int, default=2, help="Paralel tanıma işçisi sayısı")
+    parser.add_argument("--max-age", type=float, default=3.0, help="Parçaların en fazla yaşı (sn)")
+    parser.add_argument("--retries", type=int, default=2, help="Yeniden deneme sayısı")
+    parser.add_argument("--reset-timeout", type=float, default=2.0, help="Devre kesicinin bekleme süresi (sn)")
+    args = parser.parse_args()
+
+    print(f"{'senaryo':<10} {'davranış':<6} {'yazıldı':>7} {'geç':>5} {'hata':>5} {'devre':>6} "
+          f"{'tekrar':>6} {'istek':>6} {'en geç':>8} {'bitiş':>7}")
+    violations = 0
+    for scenario in SCENARIOS:
+        for label, new in (("eski", False), ("yeni", True)):
+            result = run(scenario, new, args)
+            outcomes = result["outcomes"]
+            print(f"{scenario[0]:<10} {label:<6} {outcomes.get('typed', 0):>7} {outcomes.get('stale', 0):>5} "
+                  f"{outcomes.get('request_error', 0):>5} {outcomes.get('circuit_open', 0):>6} "
+                  f"{result['retries']:>6} {result['requests']:>6} {result['worst']:>7.2f}s {result['elapsed']:>6.1f}s")
+            if new and result["worst"] > args.max_age + 0.1:
+                violations += 1
+
+    if violations:
+        print(f"BAŞARISIZ: {violations} senaryoda metin {args.max_age:.1f} sn'den geç yazıldı")
+        sys.exit(1)
+
+    print()
+    if not all([check_probe(lost=False), check_probe(lost=True)]):
+        print("BAŞARISIZ: devre kesici deneme isteğinden sonra kapanmadı")
+        sys.exit(1)
+    print(f"BAŞARILI: yeni davranışta hiçbir metin {args.max_age:.1f} sn'den geç yazılmadı ve devre yeniden kapandı")
+
+
+if __name__ == "__main__":
+    main()
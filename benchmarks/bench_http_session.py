@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MicBoard Kalıcı HTTP Oturumu Benchmark Scripti
+Bu script, her istekte yeni bağlantı açan eski urllib yolu ile
+GoogleWebBackend'in kalıcı oturumunu yerel taklit sunucuya karşı
+karşılaştırır. El sıkışma maliyeti --handshake-delay ile taklit edilir.
+Kullanım: python benchmarks/bench_http_session.py [--requests 20] [--handshake-delay 0.1]
+"""
+
+import os
+import sys
+import time
+import argparse
+from urllib.parse import urlencode
+from urllib.request import Request, urlopen
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from micboard import AudioSegment, GoogleWebBackend, UtteranceTrace
+from standin_server import StandInServer
+
+
+def urllib_request(url, payload, content_type):
+    """Eski yol: her istekte yeni bağlantı açan urllib çağrısı"""
+    params = urlencode({"client": "chromium", "lang": "tr-TR", "key": GoogleWebBackend.KEY, "pFilter": 0})
+    request = Request(f"{url}?{params}", data=payload, headers={"Content-Type": content_type})
+    return GoogleWebBackend.parse_response(urlopen(request).read().decode("utf-8"))
+
+
+def main():
+    """Ana fonksiyon."""
+    parser = argparse.ArgumentParser(description="MicBoard kalıcı HTTP oturumu benchmark aracı")
+    parser.add_argument("--requests", type=int, default=20, help="İstek sayısı")
+    parser.add_argument("--handshake-delay", type=float, default=0.1,
+                        help="Yeni bağlantı başına taklit edilen el sıkışma süresi (sn)")
+    args = parser.parse_args()
+
+    server = StandInServer(handshake_delay=args.handshake_delay).start()
+    segment = AudioSegment(np.zeros(16000, dtype="<i2").tobytes(), 16000, UtteranceTrace())
+
+    backend = GoogleWebBackend(url=server.url, upload_encoding="raw")
+    payload, content_type = backend._encode_payload(segment)
+
+    start = time.perf_counter()
+    for _ in range(args.requests):
+        urllib_request(server.url, payload, content_type)
+    urllib_ms = (time.perf_counter() - start) / args.requests * 1000
+    urllib_connections = server.counters["connections"]
+
+    backend.warmup()
+    start = time.perf_counter()
+    for _ in range(args.requests):
+        backend.recognize(segment)
+    session_ms = (time.perf_counter() - start) / args.requests * 1000
+    session_connections = server.counters["connections"] - urllib_connections
+    backend.close()
+    server.shutdown()
+
+    print(f"urllib (bağlantı/istek):  {urllib_ms:7.1f} ms/istek, {urllib_connections} bağlantı")
+    print(f"requests.Session:         {session_ms:7.1f} ms/istek, {session_connections} bağlantı (ön ısıtma dahil)")
+    print(f"İstek başına kazanç:      {urllib_ms - session_ms:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MicBoard Ölçüm Kaydı Benchmark Scripti
+Bu script, ölçüm kaydının sıcak yoldaki maliyetini ölçer: sayaç artırma,
+histogram gözlemi ve bir konuşma izinin tamamlanması (sonuç sayacı ile
+dokuz aşama histogramı) tek thread'de ve yarışan thread'lerle
+zamanlanır. Ardından sentetik sesle çalışan boru hattının /metrics
+adresi ve JSON anlık görüntüsü okunup beklenen değerler doğrulanır.
+Kullanım: python -m benchmarks.bench_metrics [--updates 200000] [--threads 4] [--utterances 5]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import threading
+import urllib.request
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from micboard import LatencyTracer, MetricsRegistry, MicBoardPipeline, UtteranceTrace
+from benchmarks.pipeline import CountingSink, MemorySource, synthetic_speech
+
+TEXT = "merhaba dünya"
+
+
+class PlainCounter:
+    """Karşılaştırma için kilitsiz, yalnızca tamsayı artıran sayaç"""
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount=1):
+        self.value += amount
+
+
+def make_trace():
+    """Tüm aşama olaylarını içeren tamamlanmış bir iz üretir"""
+    trace = UtteranceTrace()
+    now = time.perf_counter()
+    for offset, event in enumerate(("speech_end", "end_detected", "enqueued", "dequeued", "request_sent",
+                                    "response_received", "formatted", "first_keystroke", "last_keystroke")):
+        trace.mark(event, now + offset * 0.05)
+    return trace
+
+
+def time_ns(function, updates, threads):
+    """function'ı toplam updates kez (threads thread'e bölünerek) çağırır; çağrı başına ns döndürür"""
+    per_thread = updates // threads
+
+    def run():
+        for _ in range(per_thread):
+            function()
+
+    workers = [threading.Thread(target=run) for _ in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return (time.perf_counter() - start) / (per_thread * threads) * 1e9
+
+
+def measure_overhead(args):
+    """Güncelleme başına maliyet tablosunu yazdırır"""
+    registry = MetricsRegistry()
+    plain = PlainCounter()
+    counter = registry.counter("bench_total", "benchmark")
+    histogram = registry.histogram("bench_seconds", "benchmark")
+    tracer = LatencyTracer(history=1000, metrics=registry)
+    trace = make_trace()
+
+    cases = [
+        ("kilitsiz tamsayı (taban)", plain.inc, args.updates),
+        ("Counter.inc", counter.inc, args.updates),
+        ("Histogram.observe", lambda: histogram.observe(0.2), args.updates),
+        ("LatencyTracer.finish", lambda: tracer.finish(trace, "typed"), args.updates // 10),
+    ]
+    print(f"{'güncelleme':<26} {'1 thread':>10} {f'{args.threads} thread':>10}")
+    results = {}
+    for name, function, updates in cases:
+        single = time_ns(function, updates, 1)
+        contended = time_ns(function, updates, args.threads)
+        results[name] = single
+        print(f"{name:<26} {single:8.0f}ns {contended:8.0f}ns")
+    return results
+
+
+def check_pipeline(directory, args):
+    """Boru hattının ölçüm uç noktasını ve JSON anlık görüntüsünü doğrular"""
+    path = os.path.join(directory, "metrics.json")
+    sink = CountingSink()
+    pipeline = MicBoardPipeline(backend="stub", backend_options={"responses": TEXT}, typing_mode="utterance",
+                                source=MemorySource(synthetic_speech(args.utterances, 16000), 16000), sink=sink)
+    url = pipeline.serve_metrics(0)
+    pipeline.write_metrics(path, interval=0.2)
+    try:
+        pipeline.start()
+        deadline = time.monotonic() + 20
+        while pipeline.stats()["outcomes"].get("typed", 0) < args.utterances and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.5)  # En az bir anlık görüntü daha yazılsın
+
+        start = time.perf_counter()
+        with urllib.request.urlopen(url, timeout=5) as response:
+            body = response.read().decode("utf-8")
+        scrape_ms = (time.perf_counter() - start) * 1000
+        with open(path, encoding="utf-8") as f:
+            snapshot = json.load(f)
+    finally:
+        pipeline.close()
+
+    expected = {
+        f'micboard_utterances_total{{outcome="typed"}} {args.utterances}',
+        f'micboard_segments_total{{result="enqueued"}} {args.utterances}',
+        f'micboard_typed_chars_total {args.utterances * len(TEXT + " ")}',
+        f'micboard_stage_latency_seconds_count{{stage="end_to_end"}} {args.utterances}',
+        'micboard_queue_dropped_total{queue="audio_queue"} 0',
+        'micboard_capture_overflows_total 0',
+    }
+    lines = set(body.splitlines())
+    missing = sorted(expected - lines)
+    print(f"\n/metrics: {len(body.splitlines())} satır, {scrape_ms:.1f} ms")
+    print(f"JSON: {len(snapshot['metrics'])} ölçüm, karakter hızı "
+          f"{snapshot['rates'].get('micboard_typed_chars_total', 0):.1f}/sn (son aralık)")
+    if missing:
+        print("BAŞARISIZ: beklenen satırlar yok:\n  " + "\n  ".join(missing))
+        sys.exit(1)
+    if snapshot["metrics"].get('micboard_utterances_total{outcome="typed"}') != args.utterances:
+        print("BAŞARISIZ: JSON anlık görüntüsü güncel değil")
+        sys.exit(1)
+
+
+def main():
+    """Ana fonksiyon."""
+    parser = argparse.ArgumentParser(description="MicBoard ölçüm kaydı benchmark aracı")
+    parser.add_argument("--updates", type=int, default=200000, help="Durum başına güncelleme sayısı")
+    parser.add_argument("--threads", type=int, default=4, help="Yarışan thread sayısı")
+    parser.add_argument("--utterances", type=int, default=5, help="Boru hattı denetimindeki ifade sayısı")
+    args = parser.parse_args()
+
+    results = measure_overhead(args)
+    finish_us = results["LatencyTracer.finish"] / 1000
+    print(f"\nİfade başına ölçüm maliyeti ≈ {finish_us:.1f} µs (izin tamamlanması) "
+          f"+ yazılan parça başına {results['Counter.inc']:.0f} ns")
+    with tempfile.TemporaryDirectory() as directory:
+        check_pipeline(directory, args)
+    print("BAŞARILI: ölçümler uç noktada ve JSON dosyasında beklenen değerlerde")
+
+
+if __name__ == "__main__":
+    main()
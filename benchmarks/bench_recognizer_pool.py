@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MicBoard Tanıma İşçi Havuzu Benchmark Scripti
+Bu script, rastgele gecikmeli sahte bir tanıma motoru ile SpeechRecognizer'ı
+farklı işçi sayılarında çalıştırır; metinlerin konuşma sırasıyla
+text_queue'ya ulaştığını doğrular ve işçi sayısına göre verimi raporlar.
+Kullanım: python benchmarks/bench_recognizer_pool.py [--segments 40] [--workers 1 2 4 8]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import threading
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from micboard import AudioSegment, PipelineQueue, RecognitionBackend, SpeechRecognizer, UtteranceTrace
+
+
+class RandomDelayBackend(RecognitionBackend):
+    """Ağ gecikmesini rastgele bekleme ile taklit eden sahte tanıma motoru"""
+
+    name = "random-delay"
+    sample_rate = None
+
+    def __init__(self, min_delay, max_delay, seed=0):
+        super().__init__()
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def recognize(self, segment):
+        with self.lock:
+            delay = self.random.uniform(self.min_delay, self.max_delay)
+        time.sleep(delay)
+        return f"parça {int(segment.samples[0])}"
+
+
+def make_segment(index):
+    """Örnekleri parça numarası olan kısa bir ham PCM parçası üretir"""
+    return AudioSegment(np.full(160, index, dtype="<i2").tobytes(), 16000, UtteranceTrace())
+
+
+def run(workers, segments, min_delay, max_delay):
+    """Verilen işçi sayısıyla tüm parçaları tanır; (süre, sıralı mı) döndürür"""
+    audio_queue = PipelineQueue(0)
+    text_queue = PipelineQueue(0)
+    recognizer = SpeechRecognizer(audio_queue, text_queue, workers=workers,
+                                  backend=RandomDelayBackend(min_delay, max_delay))
+
+    for index in range(segments):
+        audio_queue.offer(make_segment(index))
+
+    start = time.perf_counter()
+    recognizer.start_processing()
+    texts = [text_queue.get(timeout=30).text for _ in range(segments)]
+    elapsed = time.perf_counter() - start
+    recognizer.stop_processing()
+
+    in_order = texts == [f"parça {index}" for index in range(segments)]
+    return elapsed, in_order
+
+
+def main():
+    """Ana fonksiyon."""
+    parser = argparse.ArgumentParser(description="MicBoard tanıma işçi havuzu benchmark aracı")
+    parser.add_argument("--segments", type=int, default=40, help="Tanınacak parça sayısı")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="Denenecek işçi sayıları")
+    parser.add_argument("--min-delay", type=float, default=0.05, help="En kısa sahte tanıma süresi (sn)")
+    parser.add_argument("--max-delay", type=float, default=0.25, help="En uzun sahte tanıma süresi (sn)")
+    args = parser.parse_args()
+
+    baseline = None
+    failed = False
+    for workers in args.workers:
+        elapsed, in_order = run(workers, args.segments, args.min_delay, args.max_delay)
+        baseline = baseline or elapsed
+        failed = failed or not in_order
+        print(f"{workers:2d} işçi: {elapsed:6.2f} sn  {args.segments / elapsed:6.1f} parça/sn  "
+              f"{baseline / elapsed:4.1f}x  sıra {'doğru' if in_order else 'BOZUK'}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
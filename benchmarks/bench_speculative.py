@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MicBoard Erken Tanıma Benchmark Scripti
+Bu script, ifadelerin içinde kısa duraklamalar bulunan sesi gerçek zamanlı
+hızda boru hattından geçirir ve erken (spekülatif) gönderimi kapalı,
+"resubmit" ve "commit" politikalarıyla karşılaştırır. Her ifadenin
+gerçek bitişinden son metninin yazılmasına kadar geçen süre, gönderilen
+tanıma istekleri ve sonucu atılan (boşa giden) istekler raporlanır.
+Varsayılan derlem sentetiktir; --input ile kayıtlı bir ses ve ifade
+bitişlerini içeren bir dosya verilebilir.
+Kullanım: python -m benchmarks.bench_speculative [--utterances 10] [--speculative-silence 0.2] [--latency 0.3]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from micboard import MicBoardPipeline, OutputSink
+from benchmarks.pipeline import MemorySource, load_audio
+
+RATE = 16000
+# Her istek farklı kelimeler döndürür; devam parçalarının örtüşme ayıklaması yanıltmasın
+RESPONSES = [f"öbek{index} sözü" for index in range(100)]
+
+
+class TimedSink(OutputSink):
+    """Her yazma işleminin zamanını (time.monotonic) kaydeden sahte çıkış"""
+
+    def __init__(self):
+        self.writes = []
+
+    def write(self, text):
+        self.writes.append(time.monotonic())
+
+    def press(self, action):
+        self.writes.append(time.monotonic())
+
+
+def make_corpus(utterances, rng, max_pause):
+    """İçinde kısa duraklamalar olan ifadelerden oluşan sentetik ses üretir
+
+    (örnekler, ifade bitişlerinin saniye cinsinden konumları) döndürür.
+    Her ifade bir-üç söz öbeğinden oluşur; öbekler 0.1 sn ile max_pause
+    arasında, ifadeler 1.5 sn duraklamayla ayrılır.
+    """
+    parts, ends, position = [np.zeros(RATE)], [], RATE
+    for index in range(utterances):
+        for phrase in range(rng.randint(1, 3)):
+            if phrase:
+                pause = int(rng.uniform(0.1, max_pause) * RATE)
+                parts.append(np.zeros(pause))
+                position += pause
+            length = int(rng.uniform(0.6, 1.2) * RATE)
+            t = np.arange(length) / RATE
+            pitch = 110 + 20 * (index % 5)
+            envelope = 0.6 + 0.4 * np.sin(2 * np.pi * 4 * t)
+            parts.append(sum(np.sin(2 * np.pi * pitch * k * t) / k for k in range(1, 6)) * 3000 * envelope)
+            position += length
+        ends.append(position / RATE)
+        parts.append(np.zeros(int(1.5 * RATE)))
+        position += int(1.5 * RATE)
+    signal = np.concatenate(parts) + np.random.default_rng(0).standard_normal(position) * 100
+    return signal.clip(-32768, 32767).astype("<i2"), ends
+
+
+def run(samples, ends, silence, policy, args):
+    """Derlemi bir yapılandırmayla oynatır; sonuç sözlüğü döndürür"""
+    sink = TimedSink()
+    source = MemorySource(samples, RATE, realtime=True)
+    pipeline = MicBoardPipeline(backend="stub",
+                                backend_options={"responses": RESPONSES, "latency": args.latency},
+                                typing_mode="utterance", source=source, sink=sink,
+                                speculative_silence=silence, speculative_policy=policy)
+    try:
+        pipeline.start()
+        while pipeline.recorder.is_recording:
+            time.sleep(0.05)
+        time.sleep(args.latency + 1.0)  # Son isteklerin yazılması
+        started_at = source._started_at
+        stats = pipeline.stats()
+        traces = list(pipeline.tracer.traces)
+    finally:
+        pipeline.close()
+
+    # Her ifadenin gerçek bitişinden sonraki ilk yazma, ifadenin son metnidir
+    writes = np.array(sink.writes)
+    latencies = []
+    for end in ends:
+        after = writes[writes >= started_at + end]
+        if after.size:
+            latencies.append((after[0] - started_at - end) * 1000)
+    requests = sum(1 for trace in traces if "request_sent" in trace.events)
+    wasted = sum(1 for trace in traces
+                 if trace.outcome == "speculation_cancelled" and "request_sent" in trace.events)
+    return {
+        "latencies": latencies,
+        "requests": requests,
+        "wasted": wasted,
+        "typed": stats["outcomes"].get("typed", 0),
+        "speculations": stats["speculations"],
+    }
+
+
+def main():
+    """Ana fonksiyon."""
+    parser = argparse.ArgumentParser(description="MicBoard erken tanıma benchmark aracı")
+    parser.add_argument("--utterances", type=int, default=10, help="Sentetik ifade sayısı")
+    parser.add_argument("--max-pause", type=float, default=0.45, help="İfade içindeki en uzun duraklama (sn)")
+    parser.add_argument("--speculative-silence", type=float, default=0.2, help="Erken gönderim duraklaması (sn)")
+    parser.add_argument("--latency", type=float, default=0.3, help="Sahte tanıma motorunun yanıt süresi (sn)")
+    parser.add_argument("--input", help="Kayıtlı ses (WAV ya da ham PCM); --ends ile birlikte")
+    parser.add_argument("--ends", help="Kayıttaki ifade bitişlerini (sn) satır satır içeren dosya")
+    args = parser.parse_args()
+
+    if args.input:
+        if not args.ends:
+            parser.error("--input ile birlikte ifade bitişleri (--ends) de verilmeli")
+        samples, rate = load_audio(args.input, RATE)
+        if rate != RATE:
+            parser.error(f"Kayıt {RATE} Hz olmalı ({rate} Hz verildi)")
+        with open(args.ends, encoding="utf-8") as f:
+            ends = [float(line) for line in f if line.strip()]
+    else:
+        samples, ends = make_corpus(args.utterances, random.Random(0), args.max_pause)
+    print(f"{len(ends)} ifade, {samples.size / RATE:.1f} sn ses, tanıma {args.latency * 1000:.0f} ms, "
+          f"erken gönderim {args.speculative_silence * 1000:.0f} ms duraklamada")
+
+    configurations = [("kapalı", 0.0, "resubmit"),
+                      ("resubmit", args.speculative_silence, "resubmit"),
+                      ("commit", args.speculative_silence, "commit")]
+    print(f"{'mod':<9} {'p50':>8} {'p95':>8} {'istek':>6} {'boşa':>6} {'yazılan':>8}  erken gönderim")
+    for name, silence, policy in configurations:
+        result = run(samples, ends, silence, policy, args)
+        p50, p95 = np.percentile(result["latencies"], [50, 95]) if result["latencies"] else (0.0, 0.0)
+        waste = result["wasted"] / result["requests"] * 100 if result["requests"] else 0.0
+        print(f"{name:<9} {p50:6.0f}ms {p95:6.0f}ms {result['requests']:>6} {waste:5.0f}% {result['typed']:>8}  "
+              f"{result['speculations'] if silence else '-'}")
+
+
+if __name__ == "__main__":
+    main()
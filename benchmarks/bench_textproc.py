@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MicBoard Metin Kuralları Benchmark Scripti
+Bu script, TextProcessor'ı giderek büyüyen değiştirme sözlükleriyle
+derler ve ifade başına işleme süresini ölçer. Karşılaştırma için her
+kuralı sırayla str.replace ile uygulayan basit yaklaşım da ölçülür.
+Sözlük YAML dosyasından yüklenirken geçen süre de raporlanır.
+Kullanım: python benchmarks/bench_textproc.py [--sizes 10 1000 100000] [--utterances 2000]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from micboard import TextProcessor, yaml
+
+WORDS = ("bugün", "toplantıda", "yeni", "sürüm", "için", "testleri", "çalıştırdık", "ve", "sonra",
+         "kodu", "gözden", "geçirdik", "nokta", "virgül", "yarın", "devam", "edeceğiz", "satır")
+
+
+def make_rules(size, rng):
+    """size adet bir-üç kelimelik jargon kuralı üretir"""
+    rules = {}
+    while len(rules) < size:
+        phrase = " ".join(f"terim{rng.randrange(size * 4)}" for _ in range(rng.randint(1, 3)))
+        rules[phrase] = phrase.upper().replace(" ", "_")
+    return rules
+
+
+def make_utterances(rules, count, rng):
+    """Yaklaşık her beşinci konumu sözlükteki bir ifade olan 20 kelimelik ifadeler üretir"""
+    phrases = list(rules)
+    utterances = []
+    for _ in range(count):
+        words = []
+        while len(words) < 20:
+            if phrases and rng.random() < 0.2:
+                words.extend(rng.choice(phrases).split())
+            else:
+                words.append(rng.choice(WORDS))
+        utterances.append(words)
+    return utterances
+
+
+def naive_process(rules, words):
+    """Her kuralı metin üzerinde sırayla deneyen basit yaklaşım"""
+    text = " " + " ".join(words) + " "
+    for phrase, value in rules.items():
+        if phrase in text:
+            text = text.replace(f" {phrase} ", f" {value} ")
+    return text.strip()
+
+
+def per_utterance_us(function, utterances):
+    """Fonksiyonun ifade başına medyan süresini (µs) döndürür"""
+    timings = []
+    for words in utterances:
+        start = time.perf_counter()
+        function(words)
+        timings.append(time.perf_counter() - start)
+    return float(np.median(timings)) * 1e6
+
+
+def main():
+    """Ana fonksiyon."""
+    parser = argparse.ArgumentParser(description="MicBoard metin kuralları benchmark aracı")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000, 100000],
+                        help="Denenecek sözlük boyutları")
+    parser.add_argument("--utterances", type=int, default=2000, help="Boyut başına işlenecek ifade sayısı")
+    parser.add_argument("--naive-limit", type=int, default=10000,
+                        help="Basit yaklaşımın ölçüleceği en büyük sözlük boyutu")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print(f"{'kural':>8} {'yükleme':>10} {'derleme':>10} {'trie':>10} {'basit':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            rules = make_rules(size, rng)
+            utterances = make_utterances(rules, args.utterances, rng)
+
+            path = os.path.join(directory, f"kurallar_{size}.yaml")
+            with open(path, "w", encoding="utf-8") as f:
+                yaml.safe_dump({"replacements": rules}, f, allow_unicode=True)
+            start = time.perf_counter()
+            TextProcessor.from_file(path)
+            load_ms = (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            processor = TextProcessor()
+            processor.add_rules({"replacements": rules})
+            compile_ms = (time.perf_counter() - start) * 1000
+
+            trie_us = per_utterance_us(processor.process, utterances)
+            naive = "-"
+            if size <= args.naive_limit:
+                naive = f"{per_utterance_us(lambda words: naive_process(rules, words), utterances):8.1f}µs"
+            print(f"{size:>8} {load_ms:>8.1f}ms {compile_ms:>8.1f}ms {trie_us:>8.1f}µs {naive:>10}")
+
+
+if __name__ == "__main__":
+    main()
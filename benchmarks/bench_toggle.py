@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MicBoard Etkinleştirme Gecikmesi Benchmark Scripti
+Bu script, AudioRecorder'ı gerçek bir ses cihazı gibi davranan sahte bir
+kaynakla soğuk başlatma ve hazır bekleme (standby) modlarında defalarca
+açıp kapatır. Etkinleştirmeden ilk çerçevenin yakalanmasına kadar geçen
+süreyi raporlar. Sahte cihaz, bir okuma sürerken akışın kapatıldığı
+durumları da sayar (başlat/durdur yarışı).
+Kullanım: python benchmarks/bench_toggle.py [--toggles 50] [--open-delay 0.05]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import threading
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from micboard import AudioRecorder, AudioSource, PipelineQueue
+
+
+class SimulatedDevice(AudioSource):
+    """Açılışı zaman alan ve çerçeveleri gerçek zamanlı üreten sahte ses cihazı"""
+
+    def __init__(self, rate=48000, open_delay=0.05):
+        self.rate = rate
+        self.open_delay = open_delay
+        self.opened_at = None
+        self.position = 0
+        self.reading = 0
+        self.opens = 0
+        self.close_during_read = 0
+        self.lock = threading.Lock()
+        self.noise = (np.random.default_rng(0).standard_normal(rate) * 50).astype("<i2")
+
+    def open(self):
+        time.sleep(self.open_delay)  # Cihaz açılışı (PortAudio akışı)
+        with self.lock:
+            self.opened_at = time.perf_counter()
+            self.position = 0
+            self.opens += 1
+
+    def read(self, frames):
+        with self.lock:
+            if self.opened_at is None:
+                raise OSError("Stream closed")
+            self.reading += 1
+            ready_at = self.opened_at + (self.position + frames) / self.rate
+            self.position += frames
+        try:
+            # Çerçeveler cihaz saatine göre hazır olana kadar bekle
+            delay = ready_at - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            return self.noise[:frames].tobytes()
+        finally:
+            with self.lock:
+                self.reading -= 1
+
+    def close(self):
+        with self.lock:
+            if self.reading:
+                self.close_during_read += 1
+            self.opened_at = None
+
+
+def measure(standby, args):
+    """Kaydı art arda açıp kapatır; ilk çerçeve gecikmelerini (ms) döndürür"""
+    device = SimulatedDevice(args.rate, args.open_delay)
+    recorder = AudioRecorder(PipelineQueue(), source=device, standby=standby)
+    rng = random.Random(0)
+    first_frames, first_live = [], []
+    if standby:
+        recorder.start_standby()
+        time.sleep(0.6)  # Ön kayıt dolsun
+
+    for _ in range(args.toggles):
+        recorder.start_recording()
+        deadline = time.monotonic() + 2.0
+        while (recorder.first_frame_ms is None or recorder.first_live_frame_ms is None) \
+                and time.monotonic() < deadline:
+            time.sleep(0.0005)
+        first_frames.append(recorder.first_frame_ms)
+        first_live.append(recorder.first_live_frame_ms)
+        time.sleep(args.hold)
+        recorder.stop_recording()
+        time.sleep(rng.uniform(0, args.hold))
+
+    # Bekleme olmadan hızlı aç/kapa: yarış durumunu zorlar
+    for _ in range(args.toggles * 4):
+        recorder.start_recording()
+        recorder.stop_recording()
+    recorder.shutdown()
+    return first_frames, first_live, device
+
+
+def main():
+    """Ana fonksiyon."""
+    parser = argparse.ArgumentParser(description="MicBoard etkinleştirme gecikmesi benchmark aracı")
+    parser.add_argument("--toggles", type=int, default=50, help="Aç/kapa sayısı")
+    parser.add_argument("--rate", type=int, default=48000, help="Cihazın örnekleme hızı (Hz)")
+    parser.add_argument("--open-delay", type=float, default=0.05, help="Cihaz akışının açılış süresi (sn)")
+    parser.add_argument("--hold", type=float, default=0.05, help="Her kaydın açık kalma süresi (sn)")
+    args = parser.parse_args()
+
+    chunk_ms = 1024 / args.rate * 1000
+    print(f"Parça süresi {chunk_ms:.1f} ms, cihaz açılışı {args.open_delay * 1000:.0f} ms")
+    for name, standby in (("soğuk", False), ("hazır bekleme", True)):
+        first_frames, first_live, device = measure(standby, args)
+        frame_p50, frame_p95 = np.percentile(first_frames, [50, 95])
+        live_p50, live_p95 = np.percentile(first_live, [50, 95])
+        print(f"{name:<14} ilk çerçeve p50={frame_p50:6.1f} ms p95={frame_p95:6.1f} ms  "
+              f"ilk yeni çerçeve p50={live_p50:6.1f} ms p95={live_p95:6.1f} ms  "
+              f"akış açılışı {device.opens}  okuma sırasında kapatma {device.close_during_read}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MicBoard Yazma Modları Benchmark Scripti
+Bu script, KeyboardSimulator'ı sahte bir çıkışla farklı yazma
+modlarında çalıştırır ve karakter/saniye verimini raporlar.
+Sahte çıkış her tuş vuruşu için sabit bir süre harcar.
+Kullanım: python benchmarks/bench_typing.py [--utterances 3] [--length 200]
+"""
+
+import os
+import sys
+import time
+import argparse
+import contextlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from micboard import (Clipboard, ClipboardSink, KeyboardSimulator, LatencyTracer, OutputSink,
+                      PipelineQueue, RecognizedText, UtteranceTrace)
+
+
+class RecordingSink(OutputSink):
+    """Yazılanları kaydeden, tuş vuruşu başına sabit süre harcayan sahte çıkış"""
+
+    def __init__(self, key_cost):
+        self.key_cost = key_cost
+        self.typed = []
+        self.calls = 0
+
+    def write(self, text):
+        self.calls += 1
+        time.sleep(self.key_cost * len(text))
+        self.typed.append(text)
+
+
+class FakeClipboard(Clipboard):
+    """Bellekte tutulan sahte pano"""
+
+    def __init__(self, text):
+        self.text = text
+
+    def get_text(self):
+        return self.text
+
+    def set_text(self, text):
+        self.text = text
+
+
+class PastingController:
+    """Yapıştırma kısayolunda panodaki metni kaydeden sahte klavye denetleyicisi"""
+
+    def __init__(self, clipboard, sink):
+        self.clipboard = clipboard
+        self.sink = sink
+
+    @contextlib.contextmanager
+    def pressed(self, *keys):
+        yield
+
+    def tap(self, key):
+        self.sink.write(self.clipboard.get_text())
+
+
+def run(mode, texts, key_cost, paste=False, timeout=60.0):
+    """Metinleri verilen modda yazar; (süre, çağrı sayısı, doğru mu) döndürür"""
+    text_queue = PipelineQueue(0)
+    tracer = LatencyTracer()
+    keyboard = RecordingSink(key_cost)
+    clipboard = FakeClipboard("önceki pano içeriği")
+    paste_sink = ClipboardSink(clipboard, PastingController(clipboard, keyboard), restore_delay=0.0,
+                               paste_modifier="ctrl")
+    simulator = KeyboardSimulator(text_queue, tracer, mode=mode, sink=keyboard,
+                                  paste_sink=paste_sink if paste else None, paste_threshold=1)
+
+    for text in texts:
+        text_queue.offer(RecognizedText(text, UtteranceTrace()))
+
+    start = time.perf_counter()
+    deadline = time.monotonic() + timeout
+    simulator.start_typing()
+    while len(tracer.traces) < len(texts) and time.monotonic() < deadline:
+        time.sleep(0.001)
+    elapsed = time.perf_counter() - start
+    simulator.stop_typing()
+
+    expected = "".join(text + " " for text in texts)
+    # Yapıştırmadan sonra panonun eski içeriği geri yüklenmiş olmalı
+    correct = ("".join(keyboard.typed) == expected and clipboard.text == "önceki pano içeriği"
+               and all(trace.outcome == "typed" for trace in tracer.traces))
+    return elapsed, keyboard.calls, correct
+
+
+def main():
+    """Ana fonksiyon."""
+    parser = argparse.ArgumentParser(description="MicBoard yazma modları benchmark aracı")
+    parser.add_argument("--utterances", type=int, default=3, help="Kuyruktaki ifade sayısı")
+    parser.add_argument("--length", type=int, default=200, help="İfade başına karakter sayısı")
+    parser.add_argument("--key-cost", type=float, default=0.0002, help="Sahte tuş vuruşu maliyeti (sn)")
+    args = parser.parse_args()
+
+    words = "bugün hava çok güzel ve ben de dışarı çıkmak istiyorum".split()
+    text = ""
+    while len(text) < args.length:
+        text += words[len(text) % len(words)] + " "
+    texts = [text[:args.length].strip()] * args.utterances
+    chars = sum(len(t) + 1 for t in texts)
+
+    runs = [(mode, mode, False) for mode in KeyboardSimulator.MODES] + [("paste", "char", True)]
+    for label, mode, paste in runs:
+        elapsed, calls, correct = run(mode, texts, args.key_cost, paste)
+        print(f"{label:<10} {elapsed:7.2f} sn  {chars / elapsed:9.0f} karakter/sn  "
+              f"{calls:5d} write() çağrısı  {'doğru' if correct else 'HATALI'}")
+
+
+if __name__ == "__main__":
+    main()
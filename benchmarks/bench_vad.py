@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MicBoard Sessizlik Tespiti Mikro-Benchmark Scripti
+Bu script, eski saf Python sessizlik testi ile NumPy tabanlı detektörlerin
+parça başına maliyetini karşılaştırır.
+Kullanım: python benchmarks/bench_vad.py [--chunk 1024] [--iterations 2000]
+"""
+
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from micboard import chunk_to_samples, AdaptiveSilenceDetector, PeakSilenceDetector, RmsSilenceDetector
+
+
+def legacy_is_silent(data, threshold=500):
+    """Eski sürümdeki üreteç tabanlı sessizlik testi"""
+    return max(abs(int.from_bytes(data[i:i+2], byteorder='little', signed=True))
+               for i in range(0, len(data), 2)) < threshold
+
+
+def make_chunk(chunk_size):
+    """Konuşmaya benzer rastgele bir 16-bit PCM parça üretir"""
+    rng = np.random.default_rng(0)
+    samples = (rng.standard_normal(chunk_size) * 2000).clip(-32768, 32767)
+    return samples.astype("<i2").tobytes()
+
+
+def measure(func, data, iterations):
+    """Fonksiyonun çağrı başına ortalama süresini mikrosaniye olarak döndürür"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func(data)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    """Ana fonksiyon."""
+    parser = argparse.ArgumentParser(description="MicBoard sessizlik tespiti mikro-benchmark aracı")
+    parser.add_argument("--chunk", type=int, default=1024, help="Parça başına örnek sayısı")
+    parser.add_argument("--rate", type=int, default=44100, help="Örnekleme hızı (Hz)")
+    parser.add_argument("--iterations", type=int, default=2000, help="Tekrar sayısı")
+    args = parser.parse_args()
+
+    data = make_chunk(args.chunk)
+    peak = PeakSilenceDetector()
+    rms = RmsSilenceDetector()
+    adaptive = AdaptiveSilenceDetector()
+
+    results = {
+        "legacy (Python üreteç)": measure(legacy_is_silent, data, args.iterations),
+        "PeakSilenceDetector": measure(lambda d: peak.is_silent(chunk_to_samples(d)), data, args.iterations),
+        "RmsSilenceDetector": measure(lambda d: rms.is_silent(chunk_to_samples(d)), data, args.iterations),
+        "AdaptiveSilenceDetector": measure(lambda d: adaptive.is_silent(chunk_to_samples(d)), data, args.iterations),
+    }
+
+    chunks_per_second = args.rate / args.chunk
+    print(f"Parça: {args.chunk} örnek, {chunks_per_second:.1f} parça/sn @ {args.rate} Hz")
+    for name, cost in results.items():
+        cpu_share = cost * chunks_per_second / 1e4  # Ses saniyesi başına CPU yüzdesi
+        print(f"{name:<24} {cost:10.2f} µs/parça  {cpu_share:7.3f}% CPU")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MicBoard Qt Panosu Doğrulama Scripti
+Bu script, tepsi arayüzünün Qt panosunun (micboard_tray.QtClipboard)
+Clipboard arayüzünü sağladığını ve ClipboardSink tarafından kabul
+edildiğini sınar: yapıştırma, olay döngüsü çalışırken klavye thread'i
+gibi ayrı bir thread'den yapılır; yapıştırılan metin ve panonun eski
+içeriğinin geri yüklenmesi doğrulanır. Ekran gerekmez (offscreen).
+Kullanım: python benchmarks/clipboard_check.py
+"""
+
+import os
+import sys
+import threading
+import contextlib
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QTimer
+
+from micboard import Clipboard, ClipboardSink
+from micboard_tray import QtClipboard
+
+
+def check(condition, message):
+    """Koşul sağlanmazsa hatayı yazdırıp çıkar"""
+    if not condition:
+        print(f"BAŞARISIZ: {message}")
+        sys.exit(1)
+    print(f"  tamam: {message}")
+
+
+class PastingController:
+    """Yapıştırma kısayolunda panodaki metni kaydeden sahte klavye denetleyicisi"""
+
+    def __init__(self, clipboard):
+        self.clipboard = clipboard
+        self.pasted = []
+
+    @contextlib.contextmanager
+    def pressed(self, *keys):
+        yield
+
+    def tap(self, key):
+        self.pasted.append(self.clipboard.get_text())
+
+
+def main():
+    """Ana fonksiyon."""
+    app = QApplication(sys.argv)
+    clipboard = QtClipboard()
+    check(isinstance(clipboard, Clipboard), "QtClipboard Clipboard arayüzünü sağlıyor")
+    controller = PastingController(clipboard)
+    sink = ClipboardSink(clipboard, controller, restore_delay=0.0, paste_modifier="ctrl")
+    check(True, "ClipboardSink QtClipboard'ı kabul etti")
+    try:
+        ClipboardSink(object())
+    except TypeError:
+        check(True, "pano olmayan nesne reddedildi")
+    else:
+        check(False, "pano olmayan nesne reddedildi")
+
+    app.clipboard().setText("önceki pano içeriği")
+    errors = []
+
+    def paste():
+        try:
+            sink.write("merhaba dünya")
+        except Exception as e:
+            errors.append(e)
+        finally:
+            QTimer.singleShot(0, app.quit)  # Çağrı GUI thread'ine kuyruklanır
+
+    # Yapıştırma, GUI thread'i olay döngüsündeyken ayrı bir thread'den yapılır
+    worker = threading.Thread(target=paste, daemon=True)
+    QTimer.singleShot(0, worker.start)
+    QTimer.singleShot(5000, app.quit)
+    app.exec_()
+    worker.join(1.0)
+    check(not errors and controller.pasted == ["merhaba dünya"], f"metin yapıştırıldı ({controller.pasted})")
+    check(app.clipboard().text() == "önceki pano içeriği", "panonun önceki içeriği geri yüklendi")
+    print("BAŞARILI: Qt panosu ClipboardSink ile çalışıyor")
+
+
+if __name__ == "__main__":
+    main()
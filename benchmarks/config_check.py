@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MicBoard Ayar Dosyası Doğrulama Scripti
+Bu script, ayar şemasının hataları bildirdiğini ve izlenen ayar dosyasının
+çalışan boru hattına ses kaybetmeden uygulandığını sınar: gerçek zamanlı
+sentetik sesle kayıt sürerken dosya değiştirilir, dosyaya yazmadan ayarın
+bileşende görünmesine kadar geçen süre ölçülür, ardından geçersiz bir
+dosyanın önceki ayarları bozmadığı ve tüm ifadelerin yazıldığı doğrulanır.
+Son olarak dosyadan silinen ayarların önceki değerlerine döndüğü denetlenir.
+Kullanım: python -m benchmarks.config_check [--utterances 6] [--interval 0.05]
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from micboard import MicBoardPipeline, validate_config
+from benchmarks.pipeline import CountingSink, MemorySource, synthetic_speech
+
+TEXT = "merhaba dünya"
+
+
+def check(condition, message):
+    """Koşul sağlanmazsa hatayı yazdırıp çıkar"""
+    if not condition:
+        print(f"BAŞARISIZ: {message}")
+        sys.exit(1)
+    print(f"  tamam: {message}")
+
+
+def write_config(path, text):
+    """Ayar dosyasını bir kerede yazar"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def wait_for(condition, timeout):
+    """Koşul sağlanana kadar bekler; geçen süreyi (sn) ya da zaman aşımında None döndürür"""
+    start = time.perf_counter()
+    while not condition():
+        if time.perf_counter() - start > timeout:
+            return None
+        time.sleep(0.001)
+    return time.perf_counter() - start
+
+
+def check_schema():
+    """Şemanın tüm hataları birlikte bildirdiğini sınar"""
+    try:
+        validate_config({"audio": {"end_silence_seconds": 99, "chunck": 512},
+                         "typing": {"mode": "satır", "typing_speed": "hızlı"},
+                         "ses": {}})
+    except ValueError as e:
+        errors = str(e).splitlines()
+    else:
+        errors = []
+    for line in errors:
+        print(f"    {line}")
+    check(len(errors) == 5, "beş hata tek seferde bildirildi")
+    settings = validate_config({"audio": {"end_silence_seconds": 1}, "recognition": {"retries": 3}})
+    check(settings == {("audio", "end_silence_seconds"): 1.0, ("recognition", "retries"): 3},
+          "geçerli değerler türlerine çevrildi")
+
+
+def check_live(directory, args):
+    """Kayıt sürerken ayar dosyasını değiştirir ve sonuçları doğrular"""
+    path = os.path.join(directory, "micboard.yaml")
+    write_config(path, "audio:\n  end_silence_seconds: 0.7\ntyping:\n  typing_speed: 0.001\n")
+    sink = CountingSink()
+    source = MemorySource(synthetic_speech(args.utterances, 16000), 16000, realtime=True)
+    pipeline = MicBoardPipeline(backend="stub", backend_options={"responses": TEXT},
+                                typing_mode="utterance", source=source, sink=sink)
+    pipeline.load_config(path)
+    pipeline.watch_config(path, interval=args.interval)
+    recorder = pipeline.recorder
+    chunk = recorder.chunk
+
+    try:
+        pipeline.start()
+        time.sleep(1.8)  # İlk ifadenin ortası
+
+        write_config(path, "audio:\n  end_silence_seconds: 0.5\n  chunk: 512\n"
+                           "vad:\n  start_ratio: 3.5\n"
+                           "typing:\n  typing_speed: 0.001\n  mode: word\n")
+        latency = wait_for(lambda: recorder.end_silence_seconds == 0.5, 5.0)
+        check(latency is not None, f"ayar çalışan kayda uygulandı ({latency * 1000 if latency else 0:.0f} ms, "
+                                   f"yoklama aralığı {args.interval * 1000:.0f} ms)")
+        check(wait_for(lambda: recorder.detector.start_ratio == 3.5 and pipeline.keyboard.mode == "word", 1.0)
+              is not None, "algılayıcı ve klavye ayarları güncellendi")
+        check(recorder.chunk == chunk, "chunk kayıt sürerken değişmedi (bir sonraki etkinleştirmeye kaldı)")
+
+        write_config(path, "audio:\n  end_silence_seconds: 50\n")
+        time.sleep(args.interval * 5)
+        check(recorder.end_silence_seconds == 0.5, "geçersiz dosya önceki ayarları bozmadı")
+
+        expected = args.utterances * len(TEXT + " ")
+        wait_for(lambda: pipeline.stats()["outcomes"].get("typed", 0) >= args.utterances, 20.0)
+        stats = pipeline.stats()
+        check(stats["outcomes"].get("typed") == args.utterances and sink.chars == expected,
+              f"{args.utterances} ifadenin tamamı yazıldı ({sink.chars}/{expected} karakter, "
+              f"sonuçlar {stats['outcomes']})")
+        dropped = {name: queue["dropped"] for name, queue in stats["queues"].items()}
+        check(not any(dropped.values()), f"hiçbir kuyruktan ses atılmadı ({dropped})")
+
+        pipeline.stop()
+        pipeline.start()
+        check(recorder.chunk == 512, "bekleyen chunk ayarı yeniden etkinleştirmede uygulandı")
+
+        # Pasifken akış ayarları hemen uygulanır; dosyadan silinen ayarlar önceki değerine döner
+        pipeline.stop()
+        write_config(path, "audio:\n  end_silence_seconds: 0.5\n")
+        check(wait_for(lambda: recorder.chunk == chunk and pipeline.keyboard.mode == "utterance"
+                       and recorder.detector.start_ratio != 3.5, 5.0) is not None,
+              "silinen ayarlar önceki değerlerine döndü (chunk pasifken hemen uygulandı)")
+    finally:
+        pipeline.close()
+
+
+def main():
+    """Ana fonksiyon."""
+    parser = argparse.ArgumentParser(description="MicBoard ayar dosyası doğrulama aracı")
+    parser.add_argument("--utterances", type=int, default=6, help="Sentetik ifade sayısı")
+    parser.add_argument("--interval", type=float, default=0.05, help="Ayar dosyası yoklama aralığı (sn)")
+    args = parser.parse_args()
+
+    print("Şema:")
+    check_schema()
+    with tempfile.TemporaryDirectory() as directory:
+        print("Canlı uygulama:")
+        check_live(directory, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MicBoard Headless Mod Doğrulama Scripti
+Bu script, ekran gerektirmeden kontrol soketini ve boru hattı yaşam
+döngüsünü sınar: sentetik ses, sahte tanıma motoru ve sahte klavyeyle
+çalışan bir MicBoardPipeline'ı soket üzerinden açıp kapatır ve yanıtları
+doğrular. Linux'ta ayrıca headless süreç ile Qt sürecinin bellek ve boşta
+CPU kullanımını karşılaştırır.
+Kullanım: python -m benchmarks.daemon_check [--idle 3]
+"""
+
+import os
+import sys
+import time
+import wave
+import argparse
+import tempfile
+import threading
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from micboard import ControlServer, MicBoardPipeline, send_control_command
+from benchmarks.pipeline import CountingSink, MemorySource, synthetic_speech
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def check(condition, message):
+    """Koşul sağlanmazsa hatayı yazdırıp çıkar"""
+    if not condition:
+        print(f"BAŞARISIZ: {message}")
+        sys.exit(1)
+    print(f"  tamam: {message}")
+
+
+def check_control_socket(directory):
+    """Kontrol komutlarını süreç içinde çalışan bir sunucuya karşı sınar"""
+    path = os.path.join(directory, "control.sock")
+    sink = CountingSink()
+    pipeline = MicBoardPipeline(backend="stub", backend_options={"responses": "merhaba dünya"},
+                                typing_mode="utterance", source=MemorySource(synthetic_speech(3, 16000), 16000),
+                                sink=sink)
+    quit_requested = threading.Event()
+    server = ControlServer(path, pipeline, on_quit=quit_requested.set)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    try:
+        check(send_control_command(path, "status")["active"] is False, "başlangıçta pasif")
+        check(send_control_command(path, "activate")["active"] is True, "activate boru hattını açar")
+        deadline = time.monotonic() + 10
+        while sink.chars < 3 * len("merhaba dünya ") and time.monotonic() < deadline:
+            time.sleep(0.01)
+        stats = send_control_command(path, "stats")
+        check(stats["outcomes"].get("typed") == 3, f"3 ifade yazıldı (sonuçlar {stats['outcomes']})")
+        check(stats["queues"]["audio_queue"]["dropped"] == 0, "kuyruklardan öğe atılmadı")
+        check(send_control_command(path, "deactivate")["active"] is False, "deactivate boru hattını kapatır")
+        check(send_control_command(path, "toggle")["active"] is True, "toggle yeniden açar")
+        check(send_control_command(path, "bilinmeyen")["ok"] is False, "bilinmeyen komut hata döndürür")
+        send_control_command(path, "quit")
+        check(quit_requested.is_set(), "quit kapatma isteğini iletir")
+    finally:
+        server.shutdown()
+        server.server_close()
+        pipeline.close()
+
+
+def process_usage(pid):
+    """/proc üzerinden sürecin RSS (MB) ve toplam CPU süresini (sn) okur"""
+    with open(f"/proc/{pid}/status") as f:
+        rss = next(int(line.split()[1]) for line in f if line.startswith("VmRSS:")) / 1024
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    cpu = (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    return rss, cpu
+
+
+def measure_process(command, idle, env):
+    """Süreci başlatır, açılışın bitmesini bekler ve boşta kullanımını ölçer"""
+    process = subprocess.Popen(command, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        time.sleep(2.0)  # Açılış ve arka plan ön yüklemesi
+        rss, cpu_start = process_usage(process.pid)
+        time.sleep(idle)
+        _, cpu_end = process_usage(process.pid)
+        return rss, (cpu_end - cpu_start) / idle * 100
+    finally:
+        process.kill()
+        process.wait()
+
+
+def compare_footprint(directory, idle):
+    """Headless ve Qt süreçlerinin bellek ve boşta CPU kullanımını karşılaştırır"""
+    if not os.path.exists("/proc/self/status"):
+        print("\n/proc yok; bellek karşılaştırması atlandı")
+        return
+    wav_path = os.path.join(directory, "ses.wav")
+    with wave.open(wav_path, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(16000)
+        wf.writeframes(synthetic_speech(3, 16000).tobytes())
+
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    common = [sys.executable, "micboard.py", "--backend", "stub", "--input", wav_path]
+    results = {
+        "headless": measure_process(common + ["--daemon", "--socket", os.path.join(directory, "d.sock")], idle, env),
+        "Qt": measure_process(common, idle, env),
+    }
+    print(f"\nBoşta kullanım ({idle:.0f} sn):")
+    for name, (rss, cpu) in results.items():
+        print(f"  {name:<9} {rss:7.1f} MB RSS  {cpu:5.2f}% CPU")
+
+
+def main():
+    """Ana fonksiyon."""
+    parser = argparse.ArgumentParser(description="MicBoard headless mod doğrulama aracı")
+    parser.add_argument("--idle", type=float, default=3.0, help="Boşta CPU ölçüm süresi (sn)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        print("Kontrol soketi:")
+        check_control_socket(directory)
+        compare_footprint(directory, args.idle)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MicBoard Oturum Günlüğü Doğrulama Scripti
+Bu script, sentetik sesle çalışan boru hattını küçük dosya sınırıyla
+günlüğe yazdırır; ardından dosyaların dönüşümlü açılıp en eskilerinin
+silindiğini, eşlenmiş (mmap) okuyucunun sesi bayt bayt geri verdiğini,
+sonuçların parçalarla eşleştiğini ve yarım kalmış son kaydın okumayı
+bozmadığını doğrular. Okunan parçalar, geçmişi parça sayısından kısa bir
+izleyiciyle yeniden oynatılarak replay_journal'ın tamamlandığı da
+denetlenir. Parça başına kayıt thread'inde harcanan süre ve
+okuma hızı da raporlanır.
+Kullanım: python -m benchmarks.journal_check [--utterances 12] [--max-kb 64]
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import threading
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from micboard import (AudioSegment, JournalReader, LatencyTracer, MicBoardPipeline, PipelineQueue, SegmentJournal,
+                      SpeechRecognizer, UtteranceTrace, create_backend)
+from benchmarks.pipeline import CountingSink, MemorySource, synthetic_speech
+from benchmarks.replay_journal import replay
+
+RESPONSES = [f"ifade{index} tamam" for index in range(100)]
+
+
+def check(condition, message):
+    """Koşul sağlanmazsa hatayı yazdırıp çıkar"""
+    if not condition:
+        print(f"BAŞARISIZ: {message}")
+        sys.exit(1)
+    print(f"  tamam: {message}")
+
+
+def record_session(directory, args):
+    """Boru hattını günlükle çalıştırır; gönderilen parçaların sesini döndürür"""
+    sink = CountingSink()
+    pipeline = MicBoardPipeline(backend="stub", backend_options={"responses": RESPONSES},
+                                typing_mode="utterance", sink=sink,
+                                source=MemorySource(synthetic_speech(args.utterances, 16000), 16000))
+    pipeline.open_journal(directory, args.max_kb / 1024, args.max_files)
+    sent = []
+    enqueue = pipeline.recorder._enqueue_segment
+
+    def remember(samples, *rest):
+        sent.append(samples.copy())
+        enqueue(samples, *rest)
+
+    pipeline.recorder._enqueue_segment = remember
+    try:
+        pipeline.start()
+        deadline = time.monotonic() + 20
+        while pipeline.stats()["outcomes"].get("typed", 0) < args.utterances and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        pipeline.close()
+    return sent, pipeline.journal
+
+
+def replay_entries(entries, history):
+    """Girdileri `history` izlik geçmişi olan bir izleyiciyle oynatır; (izler, süre) ya da zaman aşımında None döndürür"""
+    tracer = LatencyTracer(history=history)
+    backend = create_backend("stub", responses=RESPONSES)
+    recognizer = SpeechRecognizer(PipelineQueue(0, name="audio_queue"), PipelineQueue(0, name="text_queue"),
+                                  tracer, workers=2, backend=backend, max_age=0)
+    result = []
+    start = time.perf_counter()
+    worker = threading.Thread(target=lambda: result.append(replay(entries, recognizer, tracer)), daemon=True)
+    worker.start()
+    worker.join(20)
+    backend.close()
+    if not result:
+        return None
+    return result[0], time.perf_counter() - start
+
+
+def measure_append(directory, count):
+    """append_segment çağrısının (kayıt thread'indeki) medyan süresi (µs), yazılan MB ve toplam yazma süresi"""
+    journal = SegmentJournal(directory, 1024 * 1024 * 1024, queue_size=0)
+    data = synthetic_speech(1, 16000)[:int(2.5 * 16000)].tobytes()
+    timings = []
+    begin = time.perf_counter()
+    for _ in range(count):
+        segment = AudioSegment(data, 16000, UtteranceTrace())
+        start = time.perf_counter()
+        journal.append_segment(segment)
+        timings.append(time.perf_counter() - start)
+    journal.close()
+    return float(np.median(timings)) * 1e6, journal.bytes_written / 1024 / 1024, time.perf_counter() - begin
+
+
+def main():
+    """Ana fonksiyon."""
+    parser = argparse.ArgumentParser(description="MicBoard oturum günlüğü doğrulama aracı")
+    parser.add_argument("--utterances", type=int, default=12, help="Sentetik ifade sayısı")
+    parser.add_argument("--max-kb", type=float, default=64, help="Günlük dosyası başına sınır (KB)")
+    parser.add_argument("--max-files", type=int, default=4, help="Tutulacak en fazla dosya")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        print("Kayıt:")
+        sent, journal = record_session(os.path.join(directory, "oturum"), args)
+        files = sorted(os.listdir(journal.directory))
+        check(len(sent) == args.utterances, f"{len(sent)} parça gönderildi")
+        check(journal.file_index > args.max_files and len(files) == args.max_files,
+              f"{journal.file_index} dosya açıldı, en yeni {len(files)} tanesi tutuldu")
+        check(journal.records.dropped == 0, "yazıcı kuyruğundan kayıt atılmadı")
+
+        print("Okuma:")
+        start = time.perf_counter()
+        with JournalReader(journal.directory) as reader:
+            entries = reader.entries()
+            read_ms = (time.perf_counter() - start) * 1000
+            kept = sent[-len(entries):] if entries else []
+            check(entries and all(np.array_equal(entry.samples, samples) for entry, samples in zip(entries, kept)),
+                  f"son {len(entries)} parçanın sesi bayt bayt aynı ({read_ms:.1f} ms'de okundu)")
+            with_result = [entry for entry in entries if entry.result is not None]
+            check(len(with_result) == len(entries) and all(entry.outcome == "typed" for entry in with_result),
+                  "her parça sonucuyla eşleşti")
+            check(all(entry.text in RESPONSES and "recognition" in entry.result["stages_ms"]
+                      and entry.meta["info"].get("voiced_seconds") for entry in with_result),
+                  "metin, tanıma gecikmesi ve VAD bilgisi kaydedildi")
+            last = os.path.join(journal.directory, files[-1])
+            total = sum(1 for _ in reader.records())
+
+        print("Oynatma:")
+        with JournalReader(journal.directory) as reader:
+            entries = reader.entries()
+            replayed = replay_entries(entries, history=2)
+        check(replayed is not None and all(trace.outcome == "typed" for trace in replayed[0].values()),
+              f"{len(entries)} parça 2 izlik geçmişle oynatıldı"
+              + (f" ({replayed[1] * 1000:.0f} ms)" if replayed else ""))
+
+        # Çökmeyi taklit et: son dosyanın sonundan birkaç bayt kes
+        with open(last, "r+b") as f:
+            f.truncate(os.path.getsize(last) - 7)
+        with JournalReader(journal.directory) as reader:
+            truncated = sum(1 for _ in reader.records())
+        check(truncated == total - 1, f"yarım kalmış son kayıt atlandı ({truncated}/{total} kayıt okundu)")
+
+        print("Maliyet:")
+        append_us, megabytes, drain = measure_append(os.path.join(directory, "olcum"), 400)
+        print(f"  append_segment (kayıt thread'i): medyan {append_us:.1f} µs / 2.5 sn'lik parça")
+        print(f"  yazıcı: {megabytes:.1f} MB {drain * 1000:.0f} ms'de yazıldı ({megabytes / drain:.0f} MB/sn)")
+    print("BAŞARILI: günlük yazma, döndürme ve okuma doğrulandı")
+
+
+if __name__ == "__main__":
+    main()
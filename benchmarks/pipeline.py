@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MicBoard Uçtan Uca Boru Hattı Benchmark Scripti
+Bu script, yakalama→tanıma→yazma boru hattını mikrofon, ağ ve gerçek klavye
+olmadan çalıştırır. AudioRecorder sentetik ya da kayıtlı sesle beslenir,
+SpeechRecognizer gecikmesi ayarlanabilen StubBackend ile, KeyboardSimulator
+ise sahte bir çıkışla çalışır. VAD parça/sn, bölüt/sn, ses saniyesi başına
+CPU, tepe bellek kullanımı ve uçtan uca gecikme yüzdelikleri raporlanır.
+Sonuçlar JSON olarak kaydedilir ve önceki bir çalıştırmayla karşılaştırılabilir.
+Kullanım: python -m benchmarks.pipeline [--input kayit.wav] [--output sonuc.json] [--compare onceki.json]
+"""
+
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import subprocess
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from micboard import (AudioRecorder, KeyboardSimulator, LatencyTracer, OutputSink, PipelineQueue,
+                      ReplaySource, SpeechRecognizer, StubBackend, chunk_to_samples, open_audio_source)
+
+
+class MemorySource(ReplaySource):
+    """Bellekteki PCM örneklerini oynatan ses kaynağı"""
+
+    def __init__(self, samples, rate, realtime=False):
+        super().__init__(realtime)
+        self.rate = rate
+        self.data = samples.astype("<i2").tobytes()
+        self.position = 0
+
+    def open(self):
+        self.position = 0
+        super().open()
+
+    def _read_frames(self, frames):
+        end = self.position + frames * self.sample_width
+        data = self.data[self.position:end]
+        self.position = end
+        return data
+
+
+class CountingSink(OutputSink):
+    """Yazılan karakterleri ve basılan komut tuşlarını yalnızca sayan sahte çıkış"""
+
+    def __init__(self):
+        self.chars = 0
+        self.keys = 0
+
+    def write(self, text):
+        self.chars += len(text)
+
+    def press(self, action):
+        self.keys += 1
+
+
+def synthetic_speech(utterances, rate, seed=0):
+    """Gürültü üzerinde, duraklamalarla ayrılmış konuşmaya benzer sinyal üretir
+
+    Her ifade 1.5 sn süren, hece hızında genliği değişen harmonik bir sestir;
+    ifadeler arasında 1 sn duraklama vardır.
+    """
+    rng = np.random.default_rng(seed)
+    speech, pause = int(1.5 * rate), int(1.0 * rate)
+    t = np.arange(speech) / rate
+    envelope = 0.6 + 0.4 * np.sin(2 * np.pi * 4 * t)
+    parts = [np.zeros(pause)]
+    for index in range(utterances):
+        pitch = 110 + 20 * (index % 5)
+        voice = sum(np.sin(2 * np.pi * pitch * k * t) / k for k in range(1, 6)) * 3000 * envelope
+        parts += [voice, np.zeros(pause)]
+    signal = np.concatenate(parts) + rng.standard_normal(sum(p.size for p in parts)) * 100
+    return signal.clip(-32768, 32767).astype("<i2")
+
+
+def load_audio(path, rate):
+    """Kayıtlı sesi (WAV, ham PCM ya da '-') bir kez okuyup belleğe alır"""
+    source = open_audio_source(path, rate=rate, realtime=False)
+    source.open()
+    chunks = []
+    while True:
+        data = source.read(65536)
+        if not data:
+            break
+        chunks.append(chunk_to_samples(data))
+    source.terminate()
+    return np.concatenate(chunks) if chunks else np.zeros(0, dtype="<i2"), source.rate
+
+
+def peak_rss_mb():
+    """Sürecin o ana kadarki tepe bellek kullanımını (MB) döndürür"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux'ta KB, macOS'ta bayt cinsindendir
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def measure_segmentation(samples, rate):
+    """Yalnızca AudioRecorder'ın bölütlemesini olabildiğince hızlı çalıştırır"""
+    audio_queue = PipelineQueue()
+    source = MemorySource(samples, rate)
+    recorder = AudioRecorder(audio_queue, source=source)
+
+    wall, cpu = time.perf_counter(), time.process_time()
+    recorder.start_recording()
+    while recorder.is_recording:
+        time.sleep(0.001)
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    recorder.stop_recording()
+
+    audio_seconds = source.frames_read / rate
+    chunks = source.frames_read / recorder.chunk
+    return {
+        "audio_seconds": audio_seconds,
+        "wall_seconds": wall,
+        "vad_chunks_per_sec": chunks / max(wall, 1e-9),
+        "segments": audio_queue.qsize(),
+        "segments_rejected": recorder.segments_rejected,
+        "segments_per_sec": audio_queue.qsize() / max(wall, 1e-9),
+        "cpu_ms_per_audio_second": cpu / max(audio_seconds, 1e-9) * 1000,
+        "realtime_factor": audio_seconds / max(wall, 1e-9),
+    }
+
+
+def measure_pipeline(samples, rate, args):
+    """Kayıt, tanıma ve yazma aşamalarını birlikte çalıştırıp gecikmeleri toplar"""
+    audio_queue = PipelineQueue()
+    text_queue = PipelineQueue()
+    tracer = LatencyTracer()
+    source = MemorySource(samples, rate, realtime=args.realtime)
+    sink = CountingSink()
+    backend = StubBackend(responses=("bugün hava çok güzel",), latency=args.latency)
+    recorder = AudioRecorder(audio_queue, source=source)
+    recognizer = SpeechRecognizer(audio_queue, text_queue, tracer, workers=args.workers, backend=backend)
+    keyboard = KeyboardSimulator(text_queue, tracer, mode=args.typing_mode, sink=sink)
+    keyboard.typing_speed = args.typing_speed
+
+    wall, cpu = time.perf_counter(), time.process_time()
+    keyboard.start_typing()
+    recognizer.start_processing()
+    recorder.start_recording()
+    while recorder.is_recording:
+        time.sleep(0.001)
+    # Kuyruğa giren her parçanın izi tamamlanana kadar bekle
+    deadline = time.monotonic() + args.timeout
+    while len(tracer.traces) < recorder.segments_enqueued and time.monotonic() < deadline:
+        time.sleep(0.001)
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    recorder.stop_recording()
+    recognizer.stop_processing()
+    keyboard.stop_typing()
+
+    audio_seconds = source.frames_read / rate
+    outcomes = {}
+    for trace in tracer.traces:
+        outcomes[trace.outcome] = outcomes.get(trace.outcome, 0) + 1
+    return {
+        "audio_seconds": audio_seconds,
+        "wall_seconds": wall,
+        "segments": recorder.segments_enqueued,
+        "outcomes": outcomes,
+        "chars_typed": sink.chars,
+        "cpu_ms_per_audio_second": cpu / max(audio_seconds, 1e-9) * 1000,
+        "latency_ms": tracer.summary(),
+    }
+
+
+def run_input(name, samples, rate, args):
+    """Tek bir ses girdisi için tüm ölçümleri yapar"""
+    return {
+        "input": name,
+        "rate": rate,
+        "segmentation": measure_segmentation(samples, rate),
+        "pipeline": measure_pipeline(samples, rate, args),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def git_revision():
+    """Çalışma dizininin git sürümünü döndürür (yoksa None)"""
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL,
+                                       cwd=os.path.dirname(os.path.abspath(__file__))).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def flatten(value, prefix=""):
+    """İç içe sözlükteki sayısal değerleri noktalı anahtarlarla düzleştirir"""
+    if isinstance(value, dict):
+        items = {}
+        for key, item in value.items():
+            items.update(flatten(item, f"{prefix}{key}."))
+        return items
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return {prefix[:-1]: value}
+    return {}
+
+
+def compare(baseline, results):
+    """İki çalıştırmanın ortak girdilerdeki metriklerini yan yana yazdırır"""
+    previous = {run["input"]: flatten(run) for run in baseline["runs"]}
+    for run in results["runs"]:
+        if run["input"] not in previous:
+            continue
+        print(f"\nKarşılaştırma: {run['input']} ({baseline['meta'].get('revision')} → {results['meta'].get('revision')})")
+        old = previous[run["input"]]
+        for key, value in flatten(run).items():
+            if key not in old:
+                continue
+            change = (value - old[key]) / old[key] * 100 if old[key] else 0.0
+            print(f"  {key:<45} {old[key]:12.2f} {value:12.2f} {change:+8.1f}%")
+
+
+def print_run(run):
+    """Bir girdinin sonuçlarını özet olarak yazdırır"""
+    seg, pipe = run["segmentation"], run["pipeline"]
+    print(f"\n{run['input']} ({seg['audio_seconds']:.1f} sn ses, {run['rate']} Hz)")
+    print(f"  VAD:          {seg['vad_chunks_per_sec']:10.0f} parça/sn  {seg['segments_per_sec']:8.1f} bölüt/sn  "
+          f"{seg['cpu_ms_per_audio_second']:6.2f} ms CPU/ses-sn  ({seg['segments']} bölüt, "
+          f"{seg['segments_rejected']} atıldı)")
+    print(f"  Boru hattı:   {pipe['cpu_ms_per_audio_second']:6.2f} ms CPU/ses-sn  sonuçlar {pipe['outcomes']}  "
+          f"{pipe['chars_typed']} karakter")
+    for name, stats in pipe["latency_ms"].items():
+        print(f"  {name:<17} p50={stats['p50']:8.1f} ms  p95={stats['p95']:8.1f} ms  p99={stats['p99']:8.1f} ms")
+    if run["peak_rss_mb"] is not None:
+        print(f"  Tepe bellek:  {run['peak_rss_mb']:.1f} MB")
+
+
+def main():
+    """Ana fonksiyon."""
+    parser = argparse.ArgumentParser(description="MicBoard uçtan uca boru hattı benchmark aracı")
+    parser.add_argument("--input", action="append", default=[],
+                        help="Kayıtlı ses (WAV, ham PCM ya da '-'); birden çok kez verilebilir")
+    parser.add_argument("--rate", type=int, default=48000, help="Sentetik sesin ve ham PCM girdinin hızı (Hz)")
+    parser.add_argument("--utterances", type=int, default=20, help="Sentetik sesteki ifade sayısı (0: sentetik yok)")
+    parser.add_argument("--latency", type=float, default=0.05, help="Sahte tanıma motorunun gecikmesi (sn)")
+    parser.add_argument("--workers", type=int, default=2, help="Eşzamanlı tanıma isteği sayısı")
+    parser.add_argument("--typing-mode", choices=KeyboardSimulator.MODES, default="char", help="Yazma modu")
+    parser.add_argument("--typing-speed", type=float, default=0.0, help="Karakter başına yazma beklemesi (sn)")
+    parser.add_argument("--realtime", action="store_true", help="Boru hattı ölçümünde sesi gerçek zamanlı oynat")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Boru hattının boşalması için en uzun bekleme (sn)")
+    parser.add_argument("--output", help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--compare", help="Karşılaştırılacak önceki JSON sonuç dosyası")
+    args = parser.parse_args()
+
+    inputs = []
+    if args.utterances:
+        inputs.append(("synthetic", synthetic_speech(args.utterances, args.rate), args.rate))
+    for path in args.input:
+        samples, rate = load_audio(path, args.rate)
+        inputs.append((path, samples, rate))
+
+    results = {
+        "meta": {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "args": vars(args),
+        },
+        "runs": [run_input(name, samples, rate, args) for name, samples, rate in inputs],
+    }
+    for run in results["runs"]:
+        print_run(run)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\nSonuçlar yazıldı: {args.output}")
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            compare(json.load(f), results)
+
+
+if __name__ == "__main__":
+    main()
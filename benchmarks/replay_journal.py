@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MicBoard Oturum Günlüğü Oynatma Scripti
+Bu script, --journal ile kaydedilmiş parçaları seçilen tanıma motorundan
+beklemeden (tam hızda) geçirir ve sonuçları kayıt sırasındakilerle
+karşılaştırır: aynı/farklı metinler, sonuç dağılımı ve tanıma gecikmesi
+raporlanır. Böylece sahadan gelen bir kayıt farklı motor ya da ayarlarla
+çevrimdışı denenebilir.
+Kullanım: python benchmarks/replay_journal.py günlük_dizini [--backend vosk] [--backend-option model_path=/yol]
+          python benchmarks/replay_journal.py oturum-0001.mbj --workers 4 --output sonuclar.jsonl
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from micboard import (RECOGNITION_BACKENDS, JournalReader, LatencyTracer, PipelineQueue, SpeechRecognizer,
+                      UtteranceTrace, create_backend, parse_backend_options)
+
+
+def replay(entries, recognizer, tracer):
+    """Girdileri tanıyıcıya verir; iz kimliği -> iz sözlüğü döndürür"""
+    traces = {}
+    for entry in entries:
+        trace = UtteranceTrace()
+        trace.mark("speech_end")
+        segment = entry.to_segment(trace)
+        traces[trace.id] = trace
+        trace.mark("enqueued")
+        recognizer.audio_queue.put(segment)
+
+    def consume():
+        # tracer.traces sınırlı bir geçmiş tuttuğu için sayılmaz; her iz bir
+        # sonuç alana (tanıyıcıda ya da burada tamamlanana) kadar beklenir
+        pending = list(traces.values())
+        done = 0
+        while done < len(pending):
+            if pending[done].outcome is not None:
+                done += 1
+                continue
+            try:
+                item = recognizer.text_queue.get(timeout=0.1)
+            except Exception:
+                continue
+            tracer.finish(item.trace, "typed")
+
+    consumer = threading.Thread(target=consume, daemon=True)
+    consumer.start()
+    recognizer.start_processing()
+    consumer.join()
+    recognizer.stop_processing()
+    return traces
+
+
+def main():
+    """Ana fonksiyon."""
+    parser = argparse.ArgumentParser(description="MicBoard oturum günlüğü oynatma aracı")
+    parser.add_argument("journal", help="Günlük dizini ya da tek bir .mbj dosyası")
+    parser.add_argument("--backend", default="google", choices=sorted(RECOGNITION_BACKENDS), help="Tanıma motoru")
+    parser.add_argument("--backend-option", action="append", default=[], metavar="AD=DEĞER",
+                        help="Tanıma motoruna iletilecek seçenek (birden çok kez verilebilir)")
+    parser.add_argument("--workers", type=int, default=4, help="Paralel tanıma işçisi sayısı")
+    parser.add_argument("--outcome", help="Yalnızca kayıt sırasında bu sonucu alan parçaları oynat (ör. unknown_value)")
+    parser.add_argument("--limit", type=int, help="En fazla bu kadar parça oynat")
+    parser.add_argument("--output", help="Parça başına karşılaştırmanın yazılacağı JSONL dosyası")
+    parser.add_argument("--show", type=int, default=10, help="Yazdırılacak farklı sonuç sayısı")
+    args = parser.parse_args()
+
+    with JournalReader(args.journal) as reader:
+        start = time.perf_counter()
+        entries = reader.entries()
+        read_ms = (time.perf_counter() - start) * 1000
+        if args.outcome:
+            entries = [entry for entry in entries if entry.outcome == args.outcome]
+        entries = entries[:args.limit]
+        if not entries:
+            print("Oynatılacak parça yok")
+            return
+        audio_seconds = sum(entry.samples.size / entry.meta["rate"] for entry in entries)
+        print(f"{len(reader.paths)} dosya, {len(entries)} parça, {audio_seconds:.1f} sn ses "
+              f"({read_ms:.1f} ms'de okundu)")
+
+        tracer = LatencyTracer()
+        backend = create_backend(args.backend, **parse_backend_options(args.backend_option))
+        # Son tarih yok ve kuyruk sınırsız: hiçbir parça atlanmaz
+        recognizer = SpeechRecognizer(PipelineQueue(0, name="audio_queue"), PipelineQueue(0, name="text_queue"),
+                                      tracer, workers=args.workers, backend=backend, max_age=0)
+        start = time.perf_counter()
+        traces = replay(entries, recognizer, tracer)
+        elapsed = time.perf_counter() - start
+        backend.close()
+
+        rows, outcomes = [], {}
+        for entry, trace in zip(entries, traces.values()):
+            outcomes[trace.outcome] = outcomes.get(trace.outcome, 0) + 1
+            result = entry.result or {"info": {}, "stages_ms": {}}
+            recognition_ms = trace.duration("request_sent", "response_received")
+            rows.append({
+                "session": entry.session, "id": entry.meta["id"], "wall_time": entry.meta["wall_time"],
+                "old_backend": result["info"].get("backend"), "old_outcome": entry.outcome, "old_text": entry.text,
+                "old_recognition_ms": result["stages_ms"].get("recognition"),
+                "new_outcome": trace.outcome, "new_text": trace.text,
+                "new_recognition_ms": None if recognition_ms is None else round(recognition_ms, 1),
+            })
+
+    same = sum(1 for row in rows if row["old_text"] == row["new_text"])
+    latencies = [row["new_recognition_ms"] for row in rows if row["new_recognition_ms"] is not None]
+    print(f"Oynatma: {elapsed:.2f} sn ({audio_seconds / max(elapsed, 1e-9):.1f}x gerçek zaman), "
+          f"motor {backend.name}, {args.workers} işçi")
+    print(f"Sonuçlar: {outcomes}")
+    if latencies:
+        p50, p95 = np.percentile(latencies, [50, 95])
+        print(f"Tanıma gecikmesi: p50={p50:.0f} ms p95={p95:.0f} ms")
+    print(f"Aynı metin: {same}/{len(rows)}")
+    for row in [row for row in rows if row["old_text"] != row["new_text"]][:args.show]:
+        print(f"  #{row['id']:<5} eski ({row['old_outcome']}): {row['old_text']!r}")
+        print(f"  {'':<6} yeni ({row['new_outcome']}): {row['new_text']!r}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(row, ensure_ascii=False) + "\n")
+        print(f"Karşılaştırma yazıldı: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
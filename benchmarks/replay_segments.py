@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MicBoard Kayıttan Bölütleme Scripti
+Bu script, kayıtlı bir ses dosyasını (WAV ya da ham PCM) mikrofon yerine
+AudioRecorder'a verir ve bölütleme hızını ölçer. Mikrofon gerektirmez.
+Kullanım: python benchmarks/replay_segments.py kayit.wav [--realtime]
+          cat kayit.pcm | python benchmarks/replay_segments.py - --rate 16000
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from micboard import AudioRecorder, PipelineQueue, open_audio_source
+
+
+def main():
+    """Ana fonksiyon."""
+    parser = argparse.ArgumentParser(description="MicBoard kayıttan bölütleme aracı")
+    parser.add_argument("input", help="WAV dosyası, ham PCM dosyası ya da standart girdi için '-'")
+    parser.add_argument("--rate", type=int, default=16000, help="Ham PCM girdinin örnekleme hızı (Hz)")
+    parser.add_argument("--realtime", action="store_true", help="Sesi gerçek zamanlı hızda oynat")
+    args = parser.parse_args()
+
+    audio_queue = PipelineQueue()
+    source = open_audio_source(args.input, rate=args.rate, realtime=args.realtime)
+    recorder = AudioRecorder(audio_queue, source=source)
+
+    start = time.perf_counter()
+    recorder.start_recording()
+    while recorder.is_recording:
+        time.sleep(0.01)
+    elapsed = time.perf_counter() - start
+    recorder.stop_recording()
+
+    audio_seconds = source.frames_read / source.rate
+    segments = audio_queue.qsize()
+    print(f"Ses süresi:      {audio_seconds:.2f} sn")
+    print(f"İşlem süresi:    {elapsed:.2f} sn ({audio_seconds / max(elapsed, 1e-9):.1f}x gerçek zaman)")
+    print(f"Bölüt sayısı:    {segments} ({segments / max(elapsed, 1e-9):.1f} bölüt/sn)")
+    print(f"Atılan gürültü:  {recorder.segments_rejected} parça ({recorder.rejected_seconds:.2f} sn)")
+
+
+if __name__ == "__main__":
+    main()
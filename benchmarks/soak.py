@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MicBoard Uzun Süreli Bellek (Soak) Testi
+Bu script, saatlerce sürecek sentetik sesi olabildiğince hızlı biçimde
+kayıt → tanıma → yazma boru hattından geçirir. Desen, hiç sessizleşmeyen
+uzun bir konuşma bölümü de içerir. Isınmadan sonra bellek kullanımının
+düz kaldığını doğrular; bellek tolerans dışında büyürse çıkış kodu 1 olur.
+Kullanım: python -m benchmarks.soak [--hours 2] [--latency 0.002] [--tolerance-mb 8]
+"""
+
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from micboard import (AudioRecorder, KeyboardSimulator, LatencyTracer, PipelineQueue, ReplaySource,
+                      SpeechRecognizer, StubBackend)
+from benchmarks.pipeline import CountingSink, synthetic_speech
+
+
+class LoopSource(ReplaySource):
+    """Bir örnek desenini toplam süre dolana kadar tekrar tekrar oynatan kaynak"""
+
+    def __init__(self, pattern, rate, seconds):
+        super().__init__(realtime=False)
+        self.rate = rate
+        self.pattern = pattern.astype("<i2").tobytes()
+        self.total = int(seconds * rate) * self.sample_width
+        self.position = 0
+
+    def open(self):
+        self.position = 0
+        super().open()
+
+    def _read_frames(self, frames):
+        size = min(frames * self.sample_width, self.total - self.position)
+        if size <= 0:
+            return b""
+        start = self.position % len(self.pattern)
+        data = self.pattern[start:start + size]
+        if len(data) < size:
+            data += self.pattern[:size - len(data)]
+        self.position += size
+        return data
+
+
+def soak_pattern(rate):
+    """Duraklamalı ifadeler ile 30 sn hiç susmayan konuşmadan oluşan desen"""
+    t = np.arange(30 * rate) / rate
+    never_quiet = np.sin(2 * np.pi * 150 * t) * 3000 * (0.6 + 0.4 * np.sin(2 * np.pi * 4 * t))
+    return np.concatenate([synthetic_speech(10, rate), never_quiet.astype("<i2")])
+
+
+def current_rss_mb():
+    """Sürecin anlık bellek kullanımını (MB) döndürür; ölçülemiyorsa None"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def main():
+    """Ana fonksiyon."""
+    parser = argparse.ArgumentParser(description="MicBoard uzun süreli bellek testi")
+    parser.add_argument("--hours", type=float, default=2.0, help="Beslenecek ses süresi (saat)")
+    parser.add_argument("--rate", type=int, default=16000, help="Sentetik sesin örnekleme hızı (Hz)")
+    parser.add_argument("--queue-size", type=int, default=16, help="Aşamalar arası kuyruk kapasitesi")
+    parser.add_argument("--queue-policy", choices=PipelineQueue.POLICIES, default="drop_oldest",
+                        help="Kuyruk dolduğunda uygulanacak politika")
+    parser.add_argument("--latency", type=float, default=0.002, help="Sahte tanıma motorunun gecikmesi (sn)")
+    parser.add_argument("--warmup", type=float, default=0.25, help="Isınma sayılan ilk bölümün oranı")
+    parser.add_argument("--tolerance-mb", type=float, default=8.0, help="Isınmadan sonra izin verilen büyüme (MB)")
+    args = parser.parse_args()
+
+    if current_rss_mb() is None:
+        print("Anlık bellek ölçülemiyor (/proc/self/statm yok); test atlandı")
+        return
+
+    audio_queue = PipelineQueue(args.queue_size, args.queue_policy, name="audio_queue")
+    text_queue = PipelineQueue(args.queue_size, args.queue_policy, name="text_queue")
+    tracer = LatencyTracer(history=1000)
+    audio_queue.on_drop = lambda segment: tracer.finish(segment.trace, "dropped")
+    text_queue.on_drop = lambda item: tracer.finish(item.trace, "dropped")
+    source = LoopSource(soak_pattern(args.rate), args.rate, args.hours * 3600)
+    sink = CountingSink()
+    recorder = AudioRecorder(audio_queue, source=source)
+    recognizer = SpeechRecognizer(audio_queue, text_queue, tracer,
+                                  backend=StubBackend(responses=("bugün hava çok güzel",), latency=args.latency))
+    keyboard = KeyboardSimulator(text_queue, tracer, sink=sink)
+    keyboard.typing_speed = 0.0
+
+    total_seconds = args.hours * 3600
+    samples = []  # (ses saniyesi, RSS MB)
+    start = time.perf_counter()
+    keyboard.start_typing()
+    recognizer.start_processing()
+    recorder.start_recording()
+    next_report = 0.0
+    while recorder.is_recording:
+        time.sleep(0.2)
+        audio_seconds = source.frames_read / args.rate
+        samples.append((audio_seconds, current_rss_mb()))
+        if audio_seconds >= next_report:
+            print(f"{audio_seconds / 3600:6.2f} sa ses  {samples[-1][1]:7.1f} MB  "
+                  f"{recorder.segments_enqueued} parça, audio_queue {audio_queue.dropped} / "
+                  f"text_queue {text_queue.dropped} atıldı")
+            next_report += total_seconds / 10
+    elapsed = time.perf_counter() - start
+    recorder.stop_recording()
+    recognizer.stop_processing()
+    keyboard.stop_typing()
+
+    warm = [rss for seconds, rss in samples if seconds <= total_seconds * args.warmup]
+    rest = [rss for seconds, rss in samples if seconds > total_seconds * args.warmup]
+    baseline = max(warm) if warm else samples[0][1]
+    growth = max(rest) - baseline if rest else 0.0
+    print(f"\n{total_seconds / 3600:.2f} sa ses {elapsed:.1f} sn'de işlendi ({total_seconds / elapsed:.0f}x gerçek zaman)")
+    print(f"Parça: {recorder.segments_enqueued} gönderildi, {recorder.segments_rejected} gürültü atıldı; "
+          f"kuyruklardan atılan: audio {audio_queue.dropped}, text {text_queue.dropped}; "
+          f"{sink.chars} karakter yazıldı")
+    print(f"Bellek: ısınma sonrası taban {baseline:.1f} MB, büyüme {growth:+.1f} MB "
+          f"(tolerans {args.tolerance_mb:.1f} MB)")
+    if growth > args.tolerance_mb:
+        print("BAŞARISIZ: bellek kullanımı düz değil")
+        sys.exit(1)
+    print("BAŞARILI: bellek kullanımı düz")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MicBoard Yerel Tanıma Sunucusu (Google Web Speech API taklidi)
+Bu script, Google tanıma uç noktasını taklit eden yerel bir HTTP sunucusu
+çalıştırır. Ölçümlerde ve denemelerde gerçek servis yerine kullanılır.
+Her yeni bağlantıda el sıkışma gecikmesi, her istekte yanıt gecikmesi
+(ve rastgele ek gecikme) eklenebilir; isteklerin bir kısmı 503 hatasıyla
+yanıtlanabilir. Bu ayarlar sunucu çalışırken de değiştirilebilir.
+Kullanım: python benchmarks/standin_server.py [--port 8765] [--handshake-delay 0.1]
+          [--response-delay 0.5] [--jitter 2.0] [--error-rate 0.3]
+          python micboard.py --backend-option url=http://127.0.0.1:8765/speech-api/v2/recognize
+"""
+
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Google Web Speech API v2 yanıtlarını taklit eden istek işleyici"""
+
+    protocol_version = "HTTP/1.1"  # Keep-alive bağlantılar için
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        # Yeni bağlantı: DNS + TCP + TLS el sıkışmasını taklit et
+        self.server.count("connections")
+        if self.server.handshake_delay:
+            time.sleep(self.server.handshake_delay)
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        self.server.count("requests")
+        delay, fail = self.server.draw()
+        if delay:
+            time.sleep(delay)
+        if fail:
+            self.server.count("errors")
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = ('{"result":[]}\n' + json.dumps({
+            "result": [{"alternative": [{"transcript": self.server.transcript, "confidence": 0.9}], "final": True}],
+            "result_index": 0,
+        }, ensure_ascii=False) + "\n").encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StandInServer(ThreadingHTTPServer):
+    """Arka planda çalıştırılabilen, bağlantı ve istek sayan yerel tanıma sunucusu
+
+    Her istek response_delay + [0, jitter) saniye bekletilir ve error_rate
+    olasılıkla 503 döndürülür.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, port=0, handshake_delay=0.0, response_delay=0.0, transcript="merhaba dünya",
+                 jitter=0.0, error_rate=0.0, seed=0):
+        super().__init__(("127.0.0.1", port), StandInHandler)
+        self.handshake_delay = handshake_delay
+        self.response_delay = response_delay
+        self.transcript = transcript
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.counters = {"connections": 0, "requests": 0, "errors": 0}
+        self.lock = threading.Lock()
+
+    def count(self, name):
+        with self.lock:
+            self.counters[name] += 1
+
+    def handle_error(self, request, client_address):
+        # İstemci zaman aşımıyla bağlantıyı kapattıysa yanıt yazılamaz; beklenen durum
+        pass
+
+    def draw(self):
+        """Bir istek için (gecikme, hata verilsin mi) çifti seçer"""
+        with self.lock:
+            delay = self.response_delay + (self.random.uniform(0, self.jitter) if self.jitter else 0.0)
+            return delay, self.random.random() < self.error_rate
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/speech-api/v2/recognize"
+
+    def start(self):
+        """Sunucuyu arka plan thread'inde başlatır"""
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+
+def main():
+    """Ana fonksiyon."""
+    parser = argparse.ArgumentParser(description="MicBoard yerel tanıma sunucusu")
+    parser.add_argument("--port", type=int, default=8765, help="Dinlenecek port")
+    parser.add_argument("--handshake-delay", type=float, default=0.0, help="Yeni bağlantı başına gecikme (sn)")
+    parser.add_argument("--response-delay", type=float, default=0.0, help="İstek başına gecikme (sn)")
+    parser.add_argument("--transcript", default="merhaba dünya", help="Döndürülecek metin")
+    parser.add_argument("--jitter", type=float, default=0.0, help="İstek başına rastgele ek gecikmenin üst sınırı (sn)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 ile yanıtlanacak isteklerin oranı (0-1)")
+    args = parser.parse_args()
+
+    server = StandInServer(args.port, args.handshake_delay, args.response_delay, args.transcript,
+                           jitter=args.jitter, error_rate=args.error_rate)
+    print(f"Yerel tanıma sunucusu: {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -144,6 +144,11 @@ def build_executable(pyinstaller_path, app_path, output_dir, icon_path=None):
     if output_dir:
         cmd.extend(["--distpath", output_dir])
     
+    # micboard.py bu modülleri ilk kullanımda importlib ile yüklediği için
+    # PyInstaller onları kendiliğinden bulamaz
+    for module in ("speech_recognition", "requests", "pyaudio", "pynput.keyboard", "yaml"):
+        cmd.extend(["--hidden-import", module])
+    
     # Uygulama dosyasını ekle
     cmd.append(app_path)
     
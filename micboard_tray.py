@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+
+"""
+MicBoard Sistem Tepsisi Arayüzü
+Boru hattını (micboard.MicBoardPipeline) sistem tepsisi simgesiyle açıp
+kapatan Qt arayüzü. PyQt5 yalnızca bu modülde kullanılır; headless
+(--daemon) modda bu modül hiç yüklenmez.
+"""
+
+import sys
+import logging
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5.QtWidgets import QApplication, QSystemTrayIcon
+from PyQt5.QtGui import QIcon, QPixmap, QPainter, QColor
+from PyQt5.QtCore import QObject, pyqtSignal, Qt, QTimer
+
+logger = logging.getLogger("MicBoard")
+
+
+class QtClipboard(QObject):
+    """Qt panosuna, diğer thread'lerden çağrıldığında GUI thread'i üzerinden erişen pano
+
+    micboard.Clipboard arayüzünü (get_text/set_text) yapısal olarak uygular;
+    QObject'ten türediği için Clipboard'dan türemez, ama
+    isinstance(QtClipboard(), Clipboard) doğrudur. Çağıran
+    thread GUI thread'inin yanıtını bekler; bu yüzden GUI thread'i pano
+    kullanan thread'leri (klavye) beklememelidir.
+    """
+
+    _get_requested = pyqtSignal(object)
+    _set_requested = pyqtSignal(str)
+
+    def __init__(self):
+        super().__init__()
+        # Pano yalnızca GUI thread'inden kullanılabilir; çağıran thread yanıtı bekler
+        self._get_requested.connect(self._get, Qt.BlockingQueuedConnection)
+        self._set_requested.connect(self._set, Qt.BlockingQueuedConnection)
+
+    def get_text(self) -> Optional[str]:
+        box = []
+        self._get_requested.emit(box)
+        return box[0] if box else None
+
+    def set_text(self, text: str):
+        self._set_requested.emit(text)
+
+    def _get(self, box: list):
+        mime = QApplication.clipboard().mimeData()
+        box.append(mime.text() if mime is not None and mime.hasText() else None)
+
+    def _set(self, text: str):
+        QApplication.clipboard().setText(text)
+
+
+class MicBoardApp(QObject):
+    """Sistem tepsisi uygulaması; simgeye tıklandıkça boru hattını açıp kapatır
+
+    Tepsi simgesi oluşturulur oluşturulmaz gösterilir; boru hattı daha sonra
+    pipeline özniteliğine atanır. Boru hattını başlatma, durdurma ve kapatma
+    tek bir arka plan thread'inde sırayla yapılır: durdurma sürerken
+    yapıştırma yapan klavye thread'i panoya GUI thread'i üzerinden
+    eriştiğinden, GUI thread'i thread'lerin bitmesini beklememelidir.
+    """
+    
+    statusChanged = pyqtSignal(bool)
+    _closed = pyqtSignal()
+    
+    def __init__(self, pipeline=None):
+        super().__init__()
+        self.pipeline = pipeline
+        self.is_active = False  # İstenen durum; boru hattı arka planda buna yetişir
+        self.is_quitting = False
+        self.worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tray")
+        
+        # Sistem tepsisi simgesi
+        self._setup_tray_icon()
+        
+        # Durum değişikliği sinyalini bağla
+        self.statusChanged.connect(self._handle_status_change)
+        self._closed.connect(self.app.quit)
+    
+    def _setup_tray_icon(self):
+        """Sistem tepsisi simgesini hazırlar"""
+        # Uygulama
+        self.app = QApplication(sys.argv)
+        self.app.setQuitOnLastWindowClosed(False)
+        
+        # Simge oluştur (programatik olarak)
+        self.passive_icon = self._create_icon(False)
+        
+        # Sistem tepsisi simgesi
+        self.tray_icon = QSystemTrayIcon()
+        self.tray_icon.setIcon(self.passive_icon)
+        self.tray_icon.setToolTip("MicBoard - Sesli Klavye")
+        
+        # Tıklama olayları
+        self.tray_icon.activated.connect(self._tray_icon_activated)
+        
+        # Simgeyi göster
+        self.tray_icon.show()
+        self.active_icon = self._create_icon(True)
+    
+    def _create_icon(self, is_active: bool) -> QIcon:
+        """Programatik olarak simge oluşturur"""
+        size = 128  # İkon boyutu 128x128 olarak değiştirildi
+        pixmap = QPixmap(size, size)
+        pixmap.fill(Qt.transparent)
+        
+        # Basit bir simge çiz
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        # Arka plan rengi - Aktif için yeşil, pasif için gri
+        bg_color = QColor("#4CAF50") if is_active else QColor("#9E9E9E")
+        
+        # Daire çiz (tüm ikonu kaplayan basit bir daire)
+        painter.setBrush(bg_color)
+        painter.setPen(Qt.NoPen)
+        painter.drawEllipse(4, 4, size-8, size-8)
+        
+        # Mikrofon ikonu (basit simge)
+        painter.setBrush(QColor("white"))
+        center_x = size // 2
+        center_y = size // 2
+        
+        # Mikrofon gövdesi
+        mic_width = size // 4
+        mic_height = size // 3
+        painter.drawRoundedRect(center_x - mic_width//2, center_y - mic_height//2, 
+                               mic_width, mic_height, mic_width//4, mic_width//4)
+        
+        # Mikrofon ayağı
+        stand_width = size // 12
+        stand_height = size // 6
+        painter.drawRect(center_x - stand_width//2, center_y + mic_height//2, 
+                        stand_width, stand_height)
+        
+        # Mikrofon tabanı
+        base_width = size // 3
+        base_height = size // 16
+        painter.drawRect(center_x - base_width//2, center_y + mic_height//2 + stand_height - base_height//2, 
+                        base_width, base_height)
+        
+        painter.end()
+        
+        return QIcon(pixmap)
+    
+    def _tray_icon_activated(self, reason):
+        """Sistem tepsisi simgesine tıklandığında çağrılır"""
+        if reason == QSystemTrayIcon.Trigger:  # Sol tık
+            self.toggle_active_state()
+        elif reason == QSystemTrayIcon.Context:  # Sağ tık
+            self.quit()  # Doğrudan kapat
+    
+    def toggle_active_state(self):
+        """Aktif ve pasif durum arasında geçiş yapar"""
+        if not self.is_quitting:
+            self.statusChanged.emit(not self.is_active)
+    
+    def _handle_status_change(self, is_active: bool):
+        """Uygulama durumu değiştiğinde çağrılır"""
+        self.is_active = is_active
+        if is_active:
+            # Aktif moda geçiş
+            self.tray_icon.setIcon(self.active_icon)
+            self.worker.submit(self._run, self.pipeline.start)
+        else:
+            # Pasif moda geçiş
+            self.tray_icon.setIcon(self.passive_icon)
+            self.worker.submit(self._run, self.pipeline.stop)
+    
+    @staticmethod
+    def _run(action):
+        """Boru hattı işlemini arka plan thread'inde çalıştırır; hatayı günlüğe yazar"""
+        try:
+            action()
+        except Exception as e:
+            logger.error(f"Boru hattı işlemi başarısız: {e}")
+    
+    def run(self, on_started=None):
+        """Uygulamayı çalıştırır; on_started olay döngüsü başlayınca çağrılır"""
+        if on_started:
+            QTimer.singleShot(0, on_started)
+        # Qt olay döngüsünü başlat
+        return self.app.exec_()
+    
+    def quit(self):
+        """Uygulamayı kapatır; boru hattı kapandığında olay döngüsünden çıkılır"""
+        if self.is_quitting:
+            return
+        self.is_quitting = True
+        logger.info("Uygulama kapatılıyor...")
+        
+        # Bileşenleri durdurur, motoru kapatır ve gecikme özetini yazar; bu sürede
+        # olay döngüsü pano isteklerini yanıtlamaya devam eder
+        future = self.worker.submit(self._run, self.pipeline.close)
+        # Uygulamadan çık (sinyal GUI thread'ine kuyruklanır)
+        future.add_done_callback(lambda _: self._closed.emit())
+        self.worker.shutdown(wait=False)